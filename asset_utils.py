@@ -83,18 +83,16 @@ def get_default_categories():
               [{'id': 'cat_...', 'name': 'Property', 'keywords': ['house', ...]}, ...]
     """
     default_categories_list = []
-    existing_ids_for_generation = [] # This will store full ID strings like ["cat_1", "cat_2"]
 
-    for name, keywords in _DEFAULT_CATEGORY_DATA.items():
-        # Pass the list of already generated full ID strings and the correct prefix
-        cat_id_str = generate_unique_id(existing_ids_for_generation, prefix="cat_")
-        
+    # IDs are handed out in sequence (cat_1, cat_2, ...), which is what
+    # generate_unique_id would produce for each new one; a running counter
+    # avoids rescanning every ID generated so far.
+    for next_id_num, (name, keywords) in enumerate(_DEFAULT_CATEGORY_DATA.items(), 1):
         default_categories_list.append({
-            "id": cat_id_str,
+            "id": f"cat_{next_id_num}",
             "name": name,
             "keywords": keywords
         })
-        existing_ids_for_generation.append(cat_id_str) # Add the new string ID to the list
     return default_categories_list
 
 def guess_category(item_name: str, categories_list: list) -> str | None:
@@ -120,6 +118,9 @@ def guess_category(item_name: str, categories_list: list) -> str | None:
     # For now, just returning None.
     return None
 
+# (categories signature, Table) from the last view_categories() call
+_categories_table_cache = None
+
 def view_categories(categories_list: list, console):
     """
     Displays all available categories with their IDs and keywords.
@@ -129,10 +130,21 @@ def view_categories(categories_list: list, console):
                                   (e.g., [{'id': '...', 'name': '...', 'keywords': [...]}]).
         console: Rich console object for output
     """
+    global _categories_table_cache
     if not categories_list:
         console.print("[yellow]No categories defined yet.[/yellow]")
         return
 
+    # Reuse the table built last time if the categories are unchanged. The key is
+    # content-based because categories are edited in place.
+    cache_key = tuple(
+        (category['id'], category['name'], tuple(category.get('keywords', [])))
+        for category in categories_list
+    )
+    if _categories_table_cache is not None and _categories_table_cache[0] == cache_key:
+        console.print(_categories_table_cache[1])
+        return
+
     table = Table(title="Available Categories", box=box.ROUNDED, show_lines=True)
     table.add_column("#", style="dim", width=4, justify="right")
     table.add_column("ID", style="dim cyan", no_wrap=True)
@@ -145,6 +157,7 @@ def view_categories(categories_list: list, console):
         keywords_str = ", ".join(category.get('keywords', [])) or "-"
         table.add_row(str(idx), category['id'], category['name'], keywords_str)
     
+    _categories_table_cache = (cache_key, table)
     console.print(table)
 
 def manage_categories_interactive(categories_list: list, financial_items_list: list, console) -> list:
@@ -197,7 +210,7 @@ def manage_categories_interactive(categories_list: list, financial_items_list: l
             keywords_str = Prompt.ask("Enter keywords (comma-separated, e.g., work, company, salary)", default="", console=console)
             new_keywords = sorted(list(set(k.strip().lower() for k in keywords_str.split(',') if k.strip())))
             
-            new_id = generate_unique_id([cat['id'] for cat in categories_list])
+            new_id = generate_unique_id(cat['id'] for cat in categories_list)
             
             new_category = {
                 "id": new_id,
@@ -264,7 +277,7 @@ def manage_categories_interactive(categories_list: list, financial_items_list: l
                                     category_to_edit['name'] = new_name
                                     console.print(f"[green]Category name updated to '{new_name}'.[/green]")
                                     changes_made = True
-                                    Prompt.ask("\nPress Enter to continue...", default="", show_default=False, console=console) # Pause after successful action
+                                    console.input("\nPress Enter to continue...") # Pause after successful action
                                 else:
                                     console.print("[yellow]Name is unchanged.[/yellow]")
                                     # No pause if unchanged, menu will redraw.
@@ -286,7 +299,7 @@ def manage_categories_interactive(categories_list: list, financial_items_list: l
                                         category_to_edit['keywords'] = new_kws
                                         console.print(f"[green]Keywords replaced. New keywords: {', '.join(new_kws) if new_kws else 'None'}[/green]")
                                         changes_made = True
-                                        Prompt.ask("\nPress Enter to continue...", default="", show_default=False, console=console)
+                                        console.input("\nPress Enter to continue...")
                                     else:
                                         console.print("[yellow]Keywords are unchanged.[/yellow]")
                                 elif kw_choice_str == "Add keyword(s)":
@@ -302,7 +315,7 @@ def manage_categories_interactive(categories_list: list, financial_items_list: l
                                         category_to_edit['keywords'] = sorted(list(set(current_kws))) # Ensure unique and sort
                                         console.print(f"[green]{added_count} new keyword(s) added. Current: {', '.join(category_to_edit['keywords']) if category_to_edit['keywords'] else 'None'}[/green]")
                                         changes_made = True
-                                        Prompt.ask("\nPress Enter to continue...", default="", show_default=False, console=console)
+                                        console.input("\nPress Enter to continue...")
                                     else:
                                         console.print("[yellow]No new keywords were added (either empty input or keywords already exist).[/yellow]")
                                 elif kw_choice_str == "Remove keyword(s)":
@@ -340,7 +353,7 @@ def manage_categories_interactive(categories_list: list, financial_items_list: l
                                                 console.print(f"[green]Selected keywords removed. Current: {', '.join(category_to_edit['keywords']) if category_to_edit['keywords'] else 'None'}[/green]")
                                                 changes_made = True
                                                 removed_any = True
-                                                Prompt.ask("\nPress Enter to continue...", default="", show_default=False, console=console)
+                                                console.input("\nPress Enter to continue...")
                                             else:
                                                 console.print("[yellow]No valid keywords selected for removal or selection issue.[/yellow]")
                                         else:
@@ -354,7 +367,7 @@ def manage_categories_interactive(categories_list: list, financial_items_list: l
                                         category_to_edit['keywords'] = []
                                         console.print("[green]All keywords cleared.[/green]")
                                         changes_made = True
-                                        Prompt.ask("\nPress Enter to continue...", default="", show_default=False, console=console)
+                                        console.input("\nPress Enter to continue...")
                                     else:
                                         console.print("[yellow]Clear keywords cancelled.[/yellow]")
                                 elif kw_choice_str == "Back to category edit options": # Explicit option from list
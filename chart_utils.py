@@ -2,8 +2,11 @@
 Chart utilities for Net Worth Tracker.
 This module handles all chart generation functionality.
 """
+import hashlib
 import json
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from rich.console import Console
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -37,6 +40,19 @@ def generate_charts(snapshots: list, financial_items: list, categories: list, ch
         console.print("[yellow]No historical data (or less than 1 record) available to generate a chart.[/yellow]")
         return []
     
+    # Charts are fully determined by the data, so unchanged data means the images
+    # drawn last time can be reused without preparing data or building figures.
+    fingerprint = _chart_fingerprint(snapshots, financial_items, categories)
+    if chart_type == "all":
+        cacheable_charts = list(_MAIN_CHART_FILENAMES.items())
+    elif chart_type in _MAIN_CHART_FILENAMES:
+        cacheable_charts = [(chart_type, _MAIN_CHART_FILENAMES[chart_type])]
+    else:
+        cacheable_charts = []
+    if cacheable_charts and all(_restore_cached_chart(fingerprint, kind, filename) for kind, filename in cacheable_charts):
+        console.print("[dim]Data unchanged since these charts were last drawn; reusing the cached images.[/dim]")
+        return [filename for _, filename in cacheable_charts]
+
     plt.style.use('seaborn-v0_8-whitegrid')
     
     # Prepare data for charting using the new data structures
@@ -54,28 +70,148 @@ def generate_charts(snapshots: list, financial_items: list, categories: list, ch
         if item: specific_asset_name = item['name']
         else: console.print(f"[red]Asset ID {specific_asset_id} not found for charting.[/red]"); return []
 
-    if chart_type == "summary" or chart_type == "all":
-        filename = "net_worth_summary_chart.png"
-        _generate_summary_chart(chart_data_prepared, filename) # Pass the whole dict
-        generated_charts_list.append(filename)
+    if chart_type == "all":
+        # The three main charts are independent renders of the same prepared data,
+        # so they are drawn in parallel and reported in the usual order.
+        generated_charts_list.extend(
+            _generate_main_charts_parallel(chart_data_prepared, snapshots, financial_items, categories)
+        )
+
+    if chart_type == "summary":
+        filename = _MAIN_CHART_FILENAMES["summary"]
+        if _generate_summary_chart(chart_data_prepared, filename): # Pass the whole dict
+            generated_charts_list.append(filename)
         
-    if chart_type == "detailed" or chart_type == "all":
-        filename = "net_worth_detailed_chart.png"
-        _generate_detailed_chart(chart_data_prepared, filename) # Pass the whole dict
-        generated_charts_list.append(filename)
+    if chart_type == "detailed":
+        filename = _MAIN_CHART_FILENAMES["detailed"]
+        if _generate_detailed_chart(chart_data_prepared, filename): # Pass the whole dict
+            generated_charts_list.append(filename)
         
-    if chart_type == "category" or chart_type == "all":
-        filename = "net_worth_category_chart.png"
-        _generate_category_chart(df_for_charts, filename, snapshots, financial_items, categories)
-        generated_charts_list.append(filename)
+    if chart_type == "category":
+        filename = _MAIN_CHART_FILENAMES["category"]
+        if _generate_category_chart(df_for_charts, filename, snapshots, financial_items, categories):
+            generated_charts_list.append(filename)
         
     if chart_type == "asset" and specific_asset_name: # Check specific_asset_name now
         filename = f"{specific_asset_name.replace(' ', '_').lower()}_history_chart.png"
         _generate_single_asset_chart(chart_data_prepared, filename, specific_asset_name) # Pass name
         generated_charts_list.append(filename)
+    
+    # Only charts whose render reported a successful save are in generated_charts_list
+    for kind, filename in cacheable_charts:
+        if filename in generated_charts_list:
+            _store_cached_chart(fingerprint, kind, filename)
         
     return generated_charts_list
 
+# Output filenames for the three main chart types, in the order they are reported
+_MAIN_CHART_FILENAMES = {
+    "summary": "net_worth_summary_chart.png",
+    "detailed": "net_worth_detailed_chart.png",
+    "category": "net_worth_category_chart.png",
+}
+
+# Rendered charts are kept in the per-user cache dir as <fingerprint>-<chart type>.png,
+# one file per chart type, so it does not depend on the working directory or grow without limit
+_USER_CACHE_ROOT = (os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+                    or os.path.join(os.path.expanduser("~"), ".cache"))
+CHART_CACHE_DIR = os.path.join(_USER_CACHE_ROOT, "net_worth_tracker", "charts")
+
+def _chart_fingerprint(snapshots: list, financial_items: list, categories: list) -> str:
+    """Returns a stable hash of everything the charts are drawn from."""
+    canonical = json.dumps([snapshots, financial_items, categories], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+def _cached_chart_path(fingerprint: str, chart_type: str) -> str:
+    return os.path.join(CHART_CACHE_DIR, f"{fingerprint}-{chart_type}.png")
+
+def _restore_cached_chart(fingerprint: str, chart_type: str, chart_filename: str) -> bool:
+    """Copies a cached render to chart_filename. Returns False if there is no usable cache entry."""
+    cached_path = _cached_chart_path(fingerprint, chart_type)
+    if not os.path.exists(cached_path):
+        return False
+    try:
+        shutil.copyfile(cached_path, chart_filename)
+    except OSError:
+        return False
+    return True
+
+def _store_cached_chart(fingerprint: str, chart_type: str, chart_filename: str):
+    """Saves a freshly rendered chart to the cache. Only call this for a render that saved successfully."""
+    try:
+        os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+        shutil.copyfile(chart_filename, _cached_chart_path(fingerprint, chart_type))
+    except OSError:
+        return # The cache is only an optimisation; never fail chart generation over it
+    _evict_stale_charts(fingerprint, chart_type)
+
+def _evict_stale_charts(fingerprint: str, chart_type: str):
+    """Removes cached renders of chart_type for older data; only the latest fingerprint is kept."""
+    suffix = f"-{chart_type}.png"
+    current_name = f"{fingerprint}{suffix}"
+    try:
+        cached_names = os.listdir(CHART_CACHE_DIR)
+    except OSError:
+        return
+    for name in cached_names:
+        if name.endswith(suffix) and name != current_name:
+            try:
+                os.remove(os.path.join(CHART_CACHE_DIR, name))
+            except OSError:
+                pass
+
+# Inputs shared by every chart rendered in a worker process, set once per worker
+_worker_chart_inputs = None
+
+def _init_chart_worker(chart_data_prepared, snapshots, financial_items, categories):
+    """Process pool initializer: receives the shared chart inputs once per worker
+       instead of once per submitted chart."""
+    global _worker_chart_inputs
+    _worker_chart_inputs = (chart_data_prepared, snapshots, financial_items, categories)
+    plt.style.use('seaborn-v0_8-whitegrid')
+
+def _render_main_chart_in_worker(chart_type: str, chart_filename: str):
+    """Renders one of the main chart types in a worker process.
+       Returns the filename, or None if the chart was not saved."""
+    chart_data_prepared, snapshots, financial_items, categories = _worker_chart_inputs
+    saved = False
+    if chart_type == "summary":
+        saved = _generate_summary_chart(chart_data_prepared, chart_filename)
+    elif chart_type == "detailed":
+        saved = _generate_detailed_chart(chart_data_prepared, chart_filename)
+    elif chart_type == "category":
+        saved = _generate_category_chart(chart_data_prepared['df'], chart_filename, snapshots, financial_items, categories)
+    return chart_filename if saved else None
+
+def _generate_main_charts_parallel(chart_data_prepared, snapshots: list, financial_items: list, categories: list):
+    """
+    Renders the summary, detailed and category charts concurrently.
+    
+    pyplot keeps global figure state and is not thread-safe, so each chart is drawn
+    in its own process. Errors are reported per chart without stopping the others.
+    
+    Returns:
+        List of generated chart filenames, in summary/detailed/category order
+    """
+    completed = set()
+    with ProcessPoolExecutor(
+        max_workers=len(_MAIN_CHART_FILENAMES),
+        initializer=_init_chart_worker,
+        initargs=(chart_data_prepared, snapshots, financial_items, categories)
+    ) as executor:
+        futures = {
+            executor.submit(_render_main_chart_in_worker, chart_type, filename): chart_type
+            for chart_type, filename in _MAIN_CHART_FILENAMES.items()
+        }
+        for future in as_completed(futures):
+            chart_type = futures[future]
+            try:
+                completed.add(future.result())
+            except Exception as e:
+                console.print(f"[red]Error generating {chart_type} chart: {e}[/red]")
+    
+    return [filename for filename in _MAIN_CHART_FILENAMES.values() if filename in completed]
+
 def _prepare_chart_data(snapshots: list, financial_items: list):
     """
     Prepares data for charting from new data structures.
@@ -189,6 +325,9 @@ def _generate_summary_chart(chart_data_prepared, chart_filename):
     Args:
         chart_data_prepared: Dictionary with chart data
         chart_filename: Filename to save the chart
+        
+    Returns:
+        True if the chart was saved
     """
     df = chart_data_prepared['df']
     positive_asset_cols = chart_data_prepared['positive_asset_cols']
@@ -303,8 +442,10 @@ def _generate_summary_chart(chart_data_prepared, chart_filename):
     try:
         plt.savefig(chart_filename)
         console.print(f"[green]Summary chart saved as [cyan]{chart_filename}[/cyan][/green]")
+        return True
     except Exception as e:
         console.print(f"[bold red]An error occurred while saving the summary chart: {e}[/bold red]")
+        return False
     finally:
         plt.close(fig) # Close the figure to free memory
 
@@ -315,6 +456,9 @@ def _generate_detailed_chart(chart_data, chart_filename):
     Args:
         chart_data: Dictionary with chart data
         chart_filename: Filename to save the chart
+        
+    Returns:
+        True if the chart was saved
     """
     df = chart_data['df']
     positive_asset_cols = chart_data['positive_asset_cols'] 
@@ -496,8 +640,10 @@ def _generate_detailed_chart(chart_data, chart_filename):
     try:
         plt.savefig(chart_filename)
         console.print(f"[green]Detailed chart saved as [cyan]{chart_filename}[/cyan][/green]")
+        return True
     except Exception as e:
         console.print(f"[bold red]An error occurred while saving the detailed chart: {e}[/bold red]")
+        return False
     finally:
         plt.close(fig)  # Close the figure to free memory
 
@@ -511,6 +657,9 @@ def _generate_category_chart(df_for_charts: pd.DataFrame, chart_filename: str, s
         snapshots: List of historical snapshots (not directly used here if df is sufficient, but passed for context).
         financial_items: List of all financial item definitions.
         categories_list: List of all category definitions.
+        
+    Returns:
+        True if the chart was saved.
     """
     # Create a lookup for category_id to category_name
     category_id_to_name_lookup = {cat['id']: cat['name'] for cat in categories_list}
@@ -532,7 +681,7 @@ def _generate_category_chart(df_for_charts: pd.DataFrame, chart_filename: str, s
 
     if not item_names_grouped_by_category:
         console.print("[yellow]No items could be grouped by category for charting.[/yellow]")
-        return
+        return False
 
     fig, ax = plt.subplots(figsize=(14, 9))
     
@@ -656,8 +805,10 @@ def _generate_category_chart(df_for_charts: pd.DataFrame, chart_filename: str, s
     try:
         plt.savefig(chart_filename)
         console.print(f"[green]Category chart saved as [cyan]{chart_filename}[/cyan][/green]")
+        return True
     except Exception as e:
         console.print(f"[bold red]An error occurred while saving the category chart: {e}[/bold red]")
+        return False
     finally:
         plt.close(fig)
 
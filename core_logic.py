@@ -1,9 +1,13 @@
 # No specific imports like datetime seem needed for these functions based on current structure
 # from datetime import datetime # Only if calculate_summary_stats were to parse dates internally
 
-from datetime import datetime
+from datetime import date
+import re
 import uuid
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
+
+# Fixed YYYY-MM-DD shape used for snapshot dates; cheaper than strptime for validation
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
 
 STANDARD_MILESTONES = [
     {"value": 0, "name": "Debt Free"},  # Represents Net Worth >= 0
@@ -49,8 +53,11 @@ def calculate_enhanced_trends(snapshots: list, financial_items: list) -> dict:
         try:
             snap_date_str = snapshot.get('date')
             if not snap_date_str: continue
-            snap_datetime = datetime.strptime(snap_date_str, '%Y-%m-%d')
-            month_year_key = snap_datetime.strftime('%Y-%m') # Use YYYY-MM as a key for monthly data
+            date_match = _DATE_RE.fullmatch(snap_date_str)
+            if not date_match: continue # Skip snapshots with malformed dates
+            year_str, month_str, day_str = date_match.groups()
+            date(int(year_str), int(month_str), int(day_str)) # Range check (e.g. rejects Feb 30)
+            month_year_key = f"{year_str}-{month_str}" # Use YYYY-MM as a key for monthly data
             
             # If multiple snapshots in a month, use the latest one (first one we encounter due to sorting)
             if month_year_key not in monthly_net_worths:
@@ -273,31 +280,61 @@ def calculate_goal_projection(financial_goal: Optional[Dict[str, Any]],
         
     return base_result
 
-def generate_unique_id(id_strings_list: list, prefix: str = "id_") -> str:
+def generate_unique_id(id_strings_list: Iterable, prefix: str = "id_") -> str:
     """Generates a unique ID string (e.g., 'cat_3', 'item_10')
-    based on a list of existing ID strings with the same prefix.
+    based on the existing ID strings with the same prefix.
+    Accepts any iterable (e.g. a generator over items), so callers need not build a list.
     """
-    if not id_strings_list:
-        return f"{prefix}1" # Start with 1 if list is empty
-    
-    numeric_parts = []
+    # Track the running maximum rather than collecting every numeric part first.
+    # IDs that don't have a valid number after the prefix are ignored; if none match,
+    # this prefix starts from 1.
+    max_val = 0
+    prefix_len = len(prefix)
     for id_str in id_strings_list:
         if isinstance(id_str, str) and id_str.startswith(prefix):
             try:
-                numeric_parts.append(int(id_str[len(prefix):]))
+                id_num = int(id_str[prefix_len:])
             except ValueError:
-                # Ignore IDs that don't have a valid number after prefix
-                pass 
+                continue
+            if id_num > max_val:
+                max_val = id_num
 
-    if not numeric_parts:
-        # This case means no existing IDs with the specified prefix were found or parseable,
-        # so we start this prefix from 1.
-        max_val = 0
-    else:
-        max_val = max(numeric_parts)
-        
     return f"{prefix}{max_val + 1}"
 
+def is_valid_snapshot_date(date_str) -> bool:
+    """Returns True if date_str is a real calendar date in YYYY-MM-DD form."""
+    if not isinstance(date_str, str):
+        return False
+    date_match = _DATE_RE.fullmatch(date_str)
+    if not date_match:
+        return False
+    try:
+        date(*(int(part) for part in date_match.groups())) # Range check (e.g. rejects Feb 30)
+    except ValueError:
+        return False
+    return True
+
+def validate_snapshot_input(new_snapshot, known_item_ids) -> Optional[str]:
+    """Checks a snapshot read from outside the app before it is recorded.
+    Returns an error message, or None if it is a dict with a valid date and a list of
+    balance entries for known item ids with numeric balances.
+    """
+    if not isinstance(new_snapshot, dict):
+        return "Snapshot must be a JSON object with 'date' and 'balances'."
+    if not is_valid_snapshot_date(new_snapshot.get('date')):
+        return f"Snapshot date must be a valid YYYY-MM-DD date, got {new_snapshot.get('date')!r}."
+    balances = new_snapshot.get('balances', [])
+    if not isinstance(balances, list) or not all(isinstance(entry, dict) for entry in balances):
+        return "Snapshot 'balances' must be a list of {'item_id': ..., 'balance': ...} objects."
+    unknown_item_ids = [entry.get('item_id') for entry in balances if entry.get('item_id') not in known_item_ids]
+    if unknown_item_ids:
+        return f"Snapshot has unknown item IDs: {unknown_item_ids}"
+    non_numeric = [entry.get('item_id') for entry in balances
+                   if isinstance(entry.get('balance'), bool) or not isinstance(entry.get('balance'), (int, float))]
+    if non_numeric:
+        return f"Snapshot balances must be numbers. Not numeric for: {non_numeric}"
+    return None
+
 def calculate_summary_stats(current_snapshot_balances, financial_items, all_snapshots, categories_list):
     """
     Calculate summary statistics from the current snapshot balances and historical data.
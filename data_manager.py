@@ -1,10 +1,33 @@
 import json
 import os # For os.path.exists, etc.
+import sys # For sys.intern on repeated id strings
+from operator import itemgetter # C-level sort key for snapshot dates
 
 # Default data file name
 DATA_FILENAME = "net_worth_refactored.json"
 APP_CONFIG_FILENAME = "app_config.json" # Configuration file
 
+# Modification time of each data file as of our last load/save, keyed by absolute path.
+# Lets callers skip re-reading a file whose contents already match what is in memory.
+_synced_mtimes = {}
+
+def _record_synced_mtime(filename):
+    """Remembers the current on-disk mtime of filename after a successful load or save."""
+    try:
+        _synced_mtimes[os.path.abspath(filename)] = os.stat(filename).st_mtime_ns
+    except OSError:
+        _synced_mtimes.pop(os.path.abspath(filename), None)
+
+def is_in_sync_with_disk(filename) -> bool:
+    """Returns True if filename has not been modified since we last loaded or saved it."""
+    synced_mtime = _synced_mtimes.get(os.path.abspath(filename))
+    if synced_mtime is None:
+        return False
+    try:
+        return os.stat(filename).st_mtime_ns == synced_mtime
+    except OSError:
+        return False
+
 def load_historical_data(console, filename=None):
     """Loads all data (categories, financial_items, snapshots, achieved_milestones, financial_goal) from the JSON file."""
     if filename is None:
@@ -36,10 +59,23 @@ def load_historical_data(console, filename=None):
         for item in financial_items:
             if 'target_balance' not in item:
                 item['target_balance'] = None
+            # Category ids repeat across items; intern them so equal ids share one object
+            if isinstance(item.get('category_id'), str):
+                item['category_id'] = sys.intern(item['category_id'])
+
+        # Normalise missing dates so every snapshot can be sorted by itemgetter('date')
+        for snapshot in snapshots:
+            if 'date' not in snapshot:
+                snapshot['date'] = ''
+            # The same item ids appear in every snapshot, so intern them once here
+            for balance_entry in snapshot.get('balances', []):
+                if isinstance(balance_entry.get('item_id'), str):
+                    balance_entry['item_id'] = sys.intern(balance_entry['item_id'])
 
         # Sort snapshots by date, most recent first
-        snapshots = sorted(snapshots, key=lambda x: x.get('date', ''), reverse=True)
+        snapshots = sorted(snapshots, key=itemgetter('date'), reverse=True)
         
+        _record_synced_mtime(filename)
         if console:
             console.print(f"[green]Successfully loaded data from [cyan]{filename}[/cyan].[/green]")
         return categories, financial_items, snapshots, achieved_milestones, financial_goal
@@ -62,8 +98,12 @@ def save_historical_data(console, categories, financial_items, snapshots, achiev
     if filename is None:
         filename = DATA_FILENAME
 
-    # Ensure snapshots are sorted by date, most recent first, for consistent file structure
-    snapshots_sorted = sorted(snapshots, key=lambda x: x.get('date', ''), reverse=True)
+    # Ensure snapshots are sorted by date, most recent first, for consistent file structure.
+    # Callers normally keep that order already, so only sort when it is actually broken.
+    if is_sorted_newest_first(snapshots):
+        snapshots_sorted = snapshots
+    else:
+        snapshots_sorted = sorted(snapshots, key=itemgetter('date'), reverse=True)
 
     data_to_save = {
         "categories": categories,
@@ -76,6 +116,7 @@ def save_historical_data(console, categories, financial_items, snapshots, achiev
     try:
         with open(filename, 'w') as f:
             json.dump(data_to_save, f, indent=4)
+        _record_synced_mtime(filename)
         if console:
             console.print(f"\n[green]All data saved to [cyan]{filename}[/cyan][/green]")
     except IOError:
@@ -85,6 +126,45 @@ def save_historical_data(console, categories, financial_items, snapshots, achiev
         if console:
             console.print(f"\n[bold red]An unexpected error occurred while saving data to {filename}: {e}[/bold red]")
 
+# --- Helpers for keeping snapshots in date order ---
+
+def is_sorted_newest_first(snapshots: list) -> bool:
+    """Returns True if snapshots are already ordered by date, most recent first."""
+    return all(snapshots[i]['date'] >= snapshots[i + 1]['date'] for i in range(len(snapshots) - 1))
+
+def _newest_first_position(snapshots: list, date_str: str) -> int:
+    """Binary search on a newest-first snapshots list. Returns the index of the first
+       snapshot dated on or before date_str (len(snapshots) if there is none).
+    """
+    lo, hi = 0, len(snapshots)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if snapshots[mid]['date'] > date_str:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def insert_snapshot_sorted(snapshots: list, new_snapshot: dict) -> None:
+    """Inserts new_snapshot into a newest-first snapshots list, keeping it sorted.
+       Uses a binary search on the date instead of re-sorting the whole list.
+    """
+    snapshots.insert(_newest_first_position(snapshots, new_snapshot['date']), new_snapshot)
+
+def find_snapshot_by_date(snapshots: list, date_str: str) -> dict | None:
+    """Returns the snapshot for date_str from a newest-first snapshots list, or None.
+       The latest date is checked first since that is nearly always the one asked for;
+       otherwise a binary search is used rather than scanning every snapshot.
+    """
+    if not snapshots:
+        return None
+    if snapshots[0]['date'] == date_str:
+        return snapshots[0]
+    idx = _newest_first_position(snapshots, date_str)
+    if idx < len(snapshots) and snapshots[idx]['date'] == date_str:
+        return snapshots[idx]
+    return None
+
 # --- Functions for remembering the last opened file ---
 
 def save_last_opened_file(filepath: str):
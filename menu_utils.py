@@ -1,6 +1,13 @@
 from simple_term_menu import TerminalMenu
 from typing import List, Optional, Tuple
 
+# Standard menu styling, shared by every menu rather than rebuilt per call
+MENU_CURSOR = "► "
+MENU_CURSOR_STYLE = ("fg_green", "bold")
+MENU_HIGHLIGHT_STYLE = ("bg_blue", "bold")
+SHORTCUT_KEY_HIGHLIGHT_STYLE = ("fg_yellow", "bold")
+SHORTCUT_BRACKETS_HIGHLIGHT_STYLE = ("fg_gray", "bold")
+
 def create_menu(
     options: List[str],
     title: Optional[str] = None,
@@ -43,11 +50,11 @@ def create_menu(
     terminal_menu = TerminalMenu(
         menu_options,
         title=title,
-        menu_cursor="► ",
-        menu_cursor_style=("fg_green", "bold"),
-        menu_highlight_style=("bg_blue", "bold"),
-        shortcut_key_highlight_style=("fg_yellow", "bold"),
-        shortcut_brackets_highlight_style=("fg_gray", "bold"),
+        menu_cursor=MENU_CURSOR,
+        menu_cursor_style=MENU_CURSOR_STYLE,
+        menu_highlight_style=MENU_HIGHLIGHT_STYLE,
+        shortcut_key_highlight_style=SHORTCUT_KEY_HIGHLIGHT_STYLE,
+        shortcut_brackets_highlight_style=SHORTCUT_BRACKETS_HIGHLIGHT_STYLE,
         show_shortcut_hints=True
     )
     
@@ -81,6 +88,25 @@ def show_menu(
         return_label
     )
     
+    return run_menu(terminal_menu, clean_options, return_shortcut)
+
+def run_menu(
+    terminal_menu: TerminalMenu,
+    clean_options: List[str],
+    return_shortcut: bool = True
+) -> Tuple[Optional[int], str]:
+    """
+    Shows a menu previously built with create_menu and returns the selection.
+    Lets callers that redisplay the same menu in a loop build it only once.
+    
+    Args:
+        terminal_menu: TerminalMenu object returned by create_menu
+        clean_options: Clean option texts returned by create_menu
+        return_shortcut: Whether the menu was built with a return option
+        
+    Returns:
+        Tuple of (selected index or None if cancelled, selected option text without shortcuts)
+    """
     menu_entry_index = terminal_menu.show()
     
     # Handle ESC/q or return option
@@ -1,9 +1,10 @@
 import json
 import csv # For CSV export
-import readchar # For reading single key presses
-import sys # For sys.exit()
+import argparse # For the non-interactive subcommands
+import sys # For sys.exit() and sys.stdout
 import os # For os.path.exists()
 from datetime import datetime # For today's date
+from concurrent.futures import ThreadPoolExecutor # For loading the data file during startup
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
@@ -13,11 +14,11 @@ from rich import box
 from rich.progress import Progress
 
 # Import from our new data_manager
-from data_manager import DATA_FILENAME as DEFAULT_DATA_FILENAME, load_historical_data, save_historical_data, save_last_opened_file, load_last_opened_file
+from data_manager import DATA_FILENAME as DEFAULT_DATA_FILENAME, load_historical_data, save_historical_data, save_last_opened_file, load_last_opened_file, insert_snapshot_sorted, find_snapshot_by_date, is_in_sync_with_disk
 # Import from our new ui_display
 from ui_display import display_app_title, display_assets, print_final_summary
 # Import from our new core_logic
-from core_logic import calculate_summary_stats, generate_unique_id
+from core_logic import calculate_summary_stats, generate_unique_id, validate_snapshot_input
 # Import from our new screens module
 from screens import get_asset_balances, asset_management_screen, file_options_screen # add_new_financial_item_interactive is used within screens.py
 
@@ -33,51 +34,215 @@ from asset_utils import (
     # load_custom_categories_from_data, # This function is commented out in asset_utils.py
     # load_custom_keywords # This function is commented out in asset_utils.py
 )
-from menu_utils import show_menu
+from menu_utils import show_menu, create_menu, run_menu
 
-# Conditional import for charting
-try:
-    import chart_utils
-    CHARTING_AVAILABLE = True
-except ImportError:
-    CHARTING_AVAILABLE = False
+# Charting is optional and chart_utils pulls in matplotlib/pandas, which are slow
+# to import. It is loaded on first use by _get_chart_utils() rather than at startup.
+_chart_utils_module = None
+_chart_utils_import_attempted = False
 
 # Initialize Rich Console globally
 console = Console()
+
+# Menu entry indices; these must match the option order of the menus built in main()
+(_MENU_VIEW_EDIT_ASSETS, _MENU_QUICK_BALANCE_UPDATE, _MENU_GENERATE_CHARTS,
+ _MENU_VIEW_CATEGORIES, _MENU_FILE_OPTIONS, _MENU_EXIT) = range(6)
+(_CHART_SUMMARY, _CHART_DETAILED, _CHART_CATEGORY,
+ _CHART_SINGLE_ASSET, _CHART_ALL) = range(5)
+
+# Chart menu index -> (generate_charts chart_type, progress message) for the charts
+# that need no further input. The single asset chart has its own selection flow.
+_CHART_DISPATCH = {
+    _CHART_SUMMARY: ("summary", Text("\nGenerating summary net worth chart...", style="green")),
+    _CHART_DETAILED: ("detailed", Text("\nGenerating detailed net worth chart (all assets)...", style="green")),
+    _CHART_CATEGORY: ("category", Text("\nGenerating category-based net worth chart...", style="green")),
+    _CHART_ALL: ("all", Text("\nGenerating all chart types...", style="green")),
+}
+
+# Progress message for each chart_type, for the chart subcommand
+_CHART_DISPATCH_BY_TYPE = {chart_type: progress_text for chart_type, progress_text in _CHART_DISPATCH.values()}
+
+# Static dashboard header, built once instead of on every menu iteration
+_DASHBOARD_HEADER = Text.assemble(
+    ("NET WORTH TRACKER", "bold blue"),
+    "\n",
+    ("━" * 60, "blue"),
+    "\n"
+)
+
+# Fixed status messages, pre-styled so the markup parser is skipped on each print
+_EXIT_TEXT = Text("\nExiting application. Goodbye!", style="yellow")
+_BALANCES_SAVED_TEXT = Text("Balances updated and saved successfully.", style="green")
+_CATEGORIES_SAVED_TEXT = Text("Category changes saved successfully.", style="green")
+_CHARTS_UNAVAILABLE_TEXT = Text("\nCharts are not available. Install matplotlib and pandas to enable them.", style="yellow")
+_PRESS_ANY_KEY_TEXT = Text("\nPress any key to return to dashboard...", style="dim")
 CURRENT_DATA_FILE = DEFAULT_DATA_FILENAME  # Track the currently active data file using imported default
 
+def _get_chart_utils():
+    """Returns the chart_utils module, importing it on first call.
+       Returns None if the optional charting dependencies are not installed.
+    """
+    global _chart_utils_module, _chart_utils_import_attempted
+    if not _chart_utils_import_attempted:
+        _chart_utils_import_attempted = True
+        try:
+            import chart_utils
+            _chart_utils_module = chart_utils
+        except ImportError:
+            _chart_utils_module = None
+    return _chart_utils_module
+
+# Rendered ANSI bytes for fixed status Texts, filled in on first use by _print_static()
+_static_ansi_cache = {}
+
+def _print_static(text):
+    """Prints one of the fixed status Text constants.
+       On a terminal the rendered bytes are cached and written straight to the stdout
+       file descriptor, skipping Rich's render pipeline on every repeat. Redirected
+       output goes through the console as usual.
+    """
+    if not sys.stdout.isatty():
+        console.print(text)
+        return
+    ansi = _static_ansi_cache.get(id(text))
+    if ansi is None:
+        with console.capture() as capture:
+            console.print(text)
+        ansi = capture.get().encode(sys.stdout.encoding or "utf-8", errors="replace")
+        _static_ansi_cache[id(text)] = ansi
+    sys.stdout.flush() # Keep ordering with anything still in Python's stdout buffer
+    os.write(sys.stdout.fileno(), ansi)
+
+def _wait_for_keypress():
+    """Blocks until a single key is pressed. readchar is only imported on first use."""
+    import readchar # Deferred: only needed for this one prompt
+    try:
+        readchar.readkey()
+    except Exception:
+        pass
+
+def _run_command_line(argv) -> bool:
+    """Handles non-interactive subcommands for scripted use, bypassing the menus.
+       Returns True if a subcommand was run, False if the interactive app should start.
+    """
+    parser = argparse.ArgumentParser(
+        description="Net Worth Tracker. Run without a command for the interactive app."
+    )
+    parser.add_argument(
+        "--file",
+        help="Data file to use (defaults to the last opened file, then the default data file)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    chart_parser = subparsers.add_parser("chart", help="Generate charts without the menus")
+    chart_parser.add_argument("--kind", choices=list(_CHART_DISPATCH_BY_TYPE), default="all")
+    subparsers.add_parser("categories", help="List the categories in the data file")
+    update_parser = subparsers.add_parser("update", help="Record a snapshot of balances from a JSON file")
+    update_parser.add_argument(
+        "--from-json",
+        required=True,
+        metavar="PATH",
+        help='JSON file of the form {"date": "YYYY-MM-DD", "balances": [{"item_id": ..., "balance": ...}]}'
+    )
+    update_parser.add_argument(
+        "--create",
+        action="store_true",
+        help="Create the data file if it does not exist yet"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        return False
+
+    data_file = args.file or load_last_opened_file() or DEFAULT_DATA_FILENAME
+    (categories, financial_items, snapshots,
+     achieved_milestones, financial_goal) = load_historical_data(console, data_file)
+
+    if args.command == "chart":
+        chart_utils = _get_chart_utils()
+        if chart_utils is None:
+            console.print(_CHARTS_UNAVAILABLE_TEXT)
+            return True
+        console.print(_CHART_DISPATCH_BY_TYPE[args.kind])
+        chart_utils.generate_charts(snapshots, financial_items, categories, args.kind)
+    elif args.command == "categories":
+        view_categories(categories, console)
+    elif args.command == "update":
+        # Saving after a failed load would replace the user's data with just this snapshot
+        if not is_in_sync_with_disk(data_file):
+            if os.path.exists(data_file):
+                console.print(f"[red]Data file [cyan]{data_file}[/cyan] could not be loaded; not recording the snapshot.[/red]")
+                return True
+            if not args.create:
+                console.print(f"[red]Data file [cyan]{data_file}[/cyan] does not exist. Use --create to start a new one.[/red]")
+                return True
+        try:
+            with open(args.from_json, 'r') as f:
+                new_snapshot = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            console.print(f"[red]Could not read snapshot from [cyan]{args.from_json}[/cyan]: {e}[/red]")
+            return True
+        error = validate_snapshot_input(new_snapshot, {item['id'] for item in financial_items})
+        if error:
+            console.print(f"[red]Snapshot in [cyan]{args.from_json}[/cyan] was not recorded. {error}[/red]")
+            return True
+        new_snapshot = {"date": new_snapshot['date'], "balances": new_snapshot.get('balances', [])}
+        existing_snapshot = find_snapshot_by_date(snapshots, new_snapshot['date'])
+        if existing_snapshot is not None:
+            existing_snapshot['balances'] = new_snapshot['balances']
+        else:
+            insert_snapshot_sorted(snapshots, new_snapshot)
+        save_historical_data(console, categories, financial_items, snapshots, achieved_milestones, financial_goal, data_file)
+    return True
+
 def check_existing_data():
     """Checks for existing data files and prompts user with options."""
     global CURRENT_DATA_FILE
     
-    display_app_title(console)
+    # Parse the default filename once; reused when starting fresh
+    default_filename_base, _ = os.path.splitext(DEFAULT_DATA_FILENAME)
 
     # Try to load the last opened file path
     last_opened = load_last_opened_file()
     potential_file_to_load = None
 
     if last_opened and os.path.exists(last_opened):
-        console.print(Panel(f"Found last used data file: [cyan bold]{last_opened}[/cyan bold]", title="[bold yellow]Last Session[/bold yellow]"))
         potential_file_to_load = last_opened
     elif os.path.exists(DEFAULT_DATA_FILENAME):
         potential_file_to_load = DEFAULT_DATA_FILENAME
-    
+
+    # Loading the file is by far the most likely choice, so start reading it in the
+    # background (silently, console=None) while the title and menu are on screen.
+    prefetched_load = None
     if potential_file_to_load:
-        CURRENT_DATA_FILE = potential_file_to_load # Set this early for display
-        console.print(
-            Panel(
-                Text.assemble(
-                    ("We spotted a JSON file (", "white"),
-                    (CURRENT_DATA_FILE, "cyan bold"), # Use CURRENT_DATA_FILE for display
-                    (") which looks like it contains your net worth history.", "white")
-                ),
-                title="[bold yellow]Existing Data Found[/bold yellow]",
-                border_style="yellow",
-                padding=(1, 2)
-            )
-        )
-        console.print() # Add a blank line for spacing
+        prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        prefetched_load = prefetch_executor.submit(load_historical_data, None, potential_file_to_load)
+        prefetch_executor.shutdown(wait=False)
+
+    # The title and panels are static output ahead of the first menu, so they are
+    # buffered and reach the terminal as one write when the block exits.
+    with console:
+        display_app_title(console)
+
+        if last_opened and potential_file_to_load == last_opened:
+            console.print(Panel(f"Found last used data file: [cyan bold]{last_opened}[/cyan bold]", title="[bold yellow]Last Session[/bold yellow]"))
         
+        if potential_file_to_load:
+            CURRENT_DATA_FILE = potential_file_to_load # Set this early for display
+            console.print(
+                Panel(
+                    Text.assemble(
+                        ("We spotted a JSON file (", "white"),
+                        (CURRENT_DATA_FILE, "cyan bold"), # Use CURRENT_DATA_FILE for display
+                        (") which looks like it contains your net worth history.", "white")
+                    ),
+                    title="[bold yellow]Existing Data Found[/bold yellow]",
+                    border_style="yellow",
+                    padding=(1, 2)
+                )
+            )
+            console.print() # Add a blank line for spacing
+    
+    if potential_file_to_load:
         options = [
             f"Load existing file ({CURRENT_DATA_FILE})", # Use CURRENT_DATA_FILE
             "Start fresh (creates a new file, won't overwrite existing data)",
@@ -92,19 +257,25 @@ def check_existing_data():
         )
         
         if menu_index is None or selected_option == "Exit application":
-            console.print("\n[yellow]Exiting application. Goodbye![/yellow]")
+            console.print(_EXIT_TEXT)
             sys.exit()
             
         if selected_option == f"Load existing file ({CURRENT_DATA_FILE})":
             console.print(f"\n[green]Loading data from [cyan]{CURRENT_DATA_FILE}[/cyan]...[/green]")
-            categories, financial_items, snapshots = load_historical_data(console, CURRENT_DATA_FILE)
+            loaded_data = prefetched_load.result()
+            if is_in_sync_with_disk(CURRENT_DATA_FILE):
+                console.print(f"[green]Successfully loaded data from [cyan]{CURRENT_DATA_FILE}[/cyan].[/green]")
+            else:
+                # The background load failed or the file changed since; load it again
+                # with the console attached so any problem is reported.
+                loaded_data = load_historical_data(console, CURRENT_DATA_FILE)
+            categories, financial_items, snapshots = loaded_data
             if categories is not None: # Check if load was successful
                 save_last_opened_file(CURRENT_DATA_FILE)
             return categories, financial_items, snapshots
         elif selected_option == "Start fresh (creates a new file, won't overwrite existing data)":
-            filename_without_ext = DEFAULT_DATA_FILENAME.rsplit('.', 1)[0]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            new_filename = f"{filename_without_ext}_new_{timestamp}.json"
+            new_filename = f"{default_filename_base}_new_{timestamp}.json"
             
             console.print(f"\n[yellow]Starting fresh with no historical data.[/yellow]")
             console.print(f"[green]Your new data will be saved to [cyan]{new_filename}[/cyan] to preserve your existing data.[/green]")
@@ -122,7 +293,7 @@ def check_existing_data():
                 return categories, financial_items, snapshots
             
             console.print(f"[red]File not found: [cyan]{different_file or '(empty input)'}[/cyan]. Starting fresh.[/red]")
-            new_filename_base = different_file.rsplit('.', 1)[0] if '.' in different_file else (different_file or "net_worth_data")
+            new_filename_base = os.path.splitext(different_file)[0] or "net_worth_data"
             CURRENT_DATA_FILE = f"{new_filename_base}_new.json"
             console.print(f"[green]Your new data will be saved to [cyan]{CURRENT_DATA_FILE}[/cyan].[/green]")
             return [], [], [] # Return empty structures
@@ -134,10 +305,13 @@ def check_existing_data():
     return [], [], []
 
 def get_asset_balances(snapshot_balances, financial_items, categories_list):
-    """Iterates through snapshot balances and prompts the user for their new balances, allowing skips."""
+    """Iterates through snapshot balances and prompts the user for their new balances, allowing skips.
+       Returns True if balances were changed and confirmed, False if the user discarded
+       their changes, and None if nothing was edited (so there is nothing to save).
+    """
     if not snapshot_balances:
         console.print("[yellow]No balances to update in the current snapshot.[/yellow]")
-        return True  # Nothing to update, or operation considered successful if no items.
+        return None # Nothing to update
 
     console.print("\n[bold blue]Now, let's update the balances for your financial items[/bold blue]")
     console.print("━" * 60, style="blue")
@@ -201,7 +375,7 @@ def get_asset_balances(snapshot_balances, financial_items, categories_list):
                     return False # Indicates changes were made but user wants to discard
             else:
                 console.print("[yellow]Finished without making any changes.[/yellow]")
-                return True # No changes, proceed as if successful
+                return None # Nothing was edited
         elif user_input.lower() == 'b' and current_idx > 0:
             current_idx -= 1
             console.print("[yellow]Going back to previous item.[/yellow]")
@@ -225,11 +399,16 @@ def get_asset_balances(snapshot_balances, financial_items, categories_list):
         console.print("\n[green]Balance updates applied to current session.[/green]")
     else:
         console.print("\n[yellow]No changes were made to any balances.[/yellow]")
+        return None # Nothing was edited
     
-    return True # Indicates successful completion (even if no changes)
+    return True # Balances were changed (the no-change case returned None above)
 
 def main():
     """Main application loop."""
+    # Scripted invocations (e.g. `net_worth_tracker.py chart --kind all`) skip the menus entirely
+    if _run_command_line(sys.argv[1:]):
+        return None
+
     console.clear()
     # load_custom_keywords() # Removed, as this function is no longer used/available
     
@@ -261,160 +440,163 @@ def main():
         "File Options",
         "Exit Application"
     ]
+    # The menus never change at runtime, so build them once and just re-show them
+    main_menu, main_menu_clean_options = create_menu(
+        menu_options,
+        title="Select an option (or press shortcut key):",
+        return_shortcut=False
+    )
+    chart_options = [
+        "Summary chart: Assets over time",
+        "Detailed chart: All individual assets",
+        "Category chart: Assets by category",
+        "Single asset chart: Track one asset over time",
+        "Generate all three main chart types"
+    ]
+    chart_menu, chart_menu_clean_options = create_menu(chart_options, title="\nChart Options:")
+    
+    # Dashboard stats are only recomputed when the data has actually changed;
+    # no-op navigations (e.g. backing out of a submenu) just redraw the cached panel.
+    state_dirty = True
+    summary_panel = None
     
     while True:
-        stats = calculate_summary_stats(current_snapshot_balances, financial_items, snapshots, categories)
-        
-        console.clear()
+        if state_dirty:
+            stats = calculate_summary_stats(current_snapshot_balances, financial_items, snapshots, categories)
         
-        header_text = Text()
-        header_text.append("NET WORTH TRACKER", style="bold blue")
-        console.print(header_text)
-        console.print("━" * 60, style="blue")
-        console.print()
+            net_worth_text = Text()
+            net_worth_text.append(f"£{stats['net_worth']:,.2f}", style="bold green" if stats['net_worth'] >= 0 else "bold red")
         
-        net_worth_text = Text()
-        net_worth_text.append(f"£{stats['net_worth']:,.2f}", style="bold green" if stats['net_worth'] >= 0 else "bold red")
-        
-        if stats['has_previous_data']:
-            if stats['change_value'] > 0:
-                trend_symbol = "↑"
-                trend_style = "bold green"
-            elif stats['change_value'] < 0:
-                trend_symbol = "↓"
-                trend_style = "bold red"
-            else:
-                trend_symbol = "→"
-                trend_style = "bold yellow"
+            if stats['has_previous_data']:
+                if stats['change_value'] > 0:
+                    trend_symbol = "↑"
+                    trend_style = "bold green"
+                elif stats['change_value'] < 0:
+                    trend_symbol = "↓"
+                    trend_style = "bold red"
+                else:
+                    trend_symbol = "→"
+                    trend_style = "bold yellow"
                 
-            net_worth_text.append(f" {trend_symbol} ", style=trend_style)
-            net_worth_text.append(f"£{abs(stats['change_value']):,.2f}", 
-                                  style="green" if stats['change_value'] >= 0 else "red")
-            net_worth_text.append(f" ({abs(stats['change_percentage']):.1f}%)", 
-                                  style="green" if stats['change_value'] >= 0 else "red")
+                net_worth_text.append(f" {trend_symbol} ", style=trend_style)
+                net_worth_text.append(f"£{abs(stats['change_value']):,.2f}", 
+                                      style="green" if stats['change_value'] >= 0 else "red")
+                net_worth_text.append(f" ({abs(stats['change_percentage']):.1f}%)", 
+                                      style="green" if stats['change_value'] >= 0 else "red")
         
-        summary_content = []
-        summary_content.append(f"[bold]Current Net Worth:[/bold] {net_worth_text}")
-        summary_content.append(f"[bold]Last Updated:[/bold] {datetime.strptime(current_date, '%Y-%m-%d').strftime('%d %B %Y')}")
-        summary_content.append("")
-        summary_content.append(f"[bold]Assets:[/bold] {'£':>10}{stats['total_assets_value']:,.2f}")
-        summary_content.append(f"[bold]Debts:[/bold] {'£':>11}{stats['total_debts_value']:,.2f}")
-        summary_content.append("")
-        summary_content.append(f"[bold]Liquid Assets:[/bold] {'£':>6}{stats['liquid_assets_value']:,.2f} ({stats['liquid_percentage']:.1f}%)")
-        summary_content.append(f"[bold]Non-liquid Assets:[/bold] {'£':>2}{stats['non_liquid_assets_value']:,.2f}")
-        summary_content.append("")
-        summary_content.append(f"[bold]Total Assets:[/bold] {stats['asset_count']} across {stats['category_count']} categories")
-        
-        if stats['top_categories']:
+            summary_content = []
+            summary_content.append(f"[bold]Current Net Worth:[/bold] {net_worth_text}")
+            summary_content.append(f"[bold]Last Updated:[/bold] {datetime.strptime(current_date, '%Y-%m-%d').strftime('%d %B %Y')}")
+            summary_content.append("")
+            summary_content.append(f"[bold]Assets:[/bold] {'£':>10}{stats['total_assets_value']:,.2f}")
+            summary_content.append(f"[bold]Debts:[/bold] {'£':>11}{stats['total_debts_value']:,.2f}")
+            summary_content.append("")
+            summary_content.append(f"[bold]Liquid Assets:[/bold] {'£':>6}{stats['liquid_assets_value']:,.2f} ({stats['liquid_percentage']:.1f}%)")
+            summary_content.append(f"[bold]Non-liquid Assets:[/bold] {'£':>2}{stats['non_liquid_assets_value']:,.2f}")
             summary_content.append("")
-            summary_content.append(f"[bold]Top Categories:[/bold]")
-            for category, value in stats['top_categories']:
-                summary_content.append(f"  [yellow]{category}:[/yellow] {'£':>10}{value:,.2f}")
+            summary_content.append(f"[bold]Total Assets:[/bold] {stats['asset_count']} across {stats['category_count']} categories")
         
-        summary_panel = Panel(
-            renderable="\n".join(summary_content),
-            title="Financial Summary",
-            border_style="green",
-            box=box.ROUNDED,
-            title_align="left",
-            padding=(1, 2)
-        )
+            if stats['top_categories']:
+                summary_content.append("")
+                summary_content.append(f"[bold]Top Categories:[/bold]")
+                for category, value in stats['top_categories']:
+                    summary_content.append(f"  [yellow]{category}:[/yellow] {'£':>10}{value:,.2f}")
+        
+            summary_panel = Panel(
+                renderable="\n".join(summary_content),
+                title="Financial Summary",
+                border_style="green",
+                box=box.ROUNDED,
+                title_align="left",
+                padding=(1, 2)
+            )
+            state_dirty = False
         
-        console.print(summary_panel)
-        console.print()
+        # Buffer the whole redraw so it reaches the terminal as a single write
+        with console:
+            console.clear()
+            console.print(_DASHBOARD_HEADER)
+            console.print(summary_panel)
+            console.print()
         
-        menu_index, selected_option = show_menu(
-            menu_options,
-            title="Select an option (or press shortcut key):",
-            return_shortcut=False
-        )
+        menu_index, _ = run_menu(main_menu, main_menu_clean_options, return_shortcut=False)
         
-        if menu_index is None:
-            console.print("\n[yellow]Exiting application. Goodbye![/yellow]")
-            sys.exit()
+        if menu_index is None or menu_index == _MENU_EXIT:
+            console.print(_EXIT_TEXT)
+            break # Leave the loop so main() returns normally
         
-        skip_key_prompt = False
+        # Only branches that leave output worth reading pause before the dashboard redraw;
+        # everything else goes straight back to it.
+        pause_for_keypress = False
         
-        if selected_option == "View/Edit Assets":
+        if menu_index == _MENU_VIEW_EDIT_ASSETS:
             categories, financial_items, snapshots, current_snapshot_balances, changes_made_overall = asset_management_screen(
                 console, # MODIFIED
                 categories, financial_items, snapshots, 
                 current_snapshot_balances, 
                 current_date
             )
-        elif selected_option == "Quick Balance Update":
+            # Categories edited via 'c' come back in place and are not reported as changes,
+            # so the summary is always rebuilt after this screen
+            state_dirty = True
+        elif menu_index == _MENU_QUICK_BALANCE_UPDATE:
             balance_result = get_asset_balances(console, current_snapshot_balances, financial_items, categories) # MODIFIED
+            pause_for_keypress = True
+            # None means the user left without editing anything: skip the write-back and save
             if balance_result:
-                # Update the main snapshots list before saving
-                updated_snapshots = snapshots.copy() # Start with existing snapshots
-                found_snapshot_for_date = False
-                for i, snap in enumerate(updated_snapshots):
-                    if snap.get('date') == current_date:
-                        updated_snapshots[i]['balances'] = current_snapshot_balances
-                        found_snapshot_for_date = True
-                        break
-                if not found_snapshot_for_date:
-                    updated_snapshots.append({"date": current_date, "balances": current_snapshot_balances})
-                # Re-sort snapshots after potential append or if order matters strictly before save
-                snapshots = sorted(updated_snapshots, key=lambda x: x.get('date', ''), reverse=True)
+                # Update the main snapshots list before saving. Snapshots stay sorted newest
+                # first: an in-place update keeps the order and a new one is inserted in place.
+                snapshot_for_date = find_snapshot_by_date(snapshots, current_date)
+                if snapshot_for_date is not None:
+                    snapshot_for_date['balances'] = current_snapshot_balances
+                else:
+                    insert_snapshot_sorted(snapshots, {"date": current_date, "balances": current_snapshot_balances})
                 
-                save_historical_data(console, categories, financial_items, snapshots, CURRENT_DATA_FILE)
-                save_last_opened_file(CURRENT_DATA_FILE) # Remember this file
-                console.print("[green]Balances updated and saved successfully.[/green]")
-        elif selected_option == "Generate Charts" and CHARTING_AVAILABLE:
+                # Save and report in one terminal write
+                with console:
+                    save_historical_data(console, categories, financial_items, snapshots, CURRENT_DATA_FILE)
+                    save_last_opened_file(CURRENT_DATA_FILE) # Remember this file
+                    console.print(_BALANCES_SAVED_TEXT)
+                state_dirty = True
+        elif menu_index == _MENU_GENERATE_CHARTS and _get_chart_utils() is None:
+            console.print(_CHARTS_UNAVAILABLE_TEXT)
+            pause_for_keypress = True
+        elif menu_index == _MENU_GENERATE_CHARTS:
+            chart_utils = _get_chart_utils()
             # chart_utils.generate_charts will primarily need snapshots,
             # but might also use financial_items and categories for richer charts.
             # Charts submenu
-            chart_options = [
-                "Summary chart: Assets over time",
-                "Detailed chart: All individual assets",
-                "Category chart: Assets by category",
-                "Single asset chart: Track one asset over time",
-                "Generate all three main chart types"
-            ]
-            
-            menu_index, selected_chart = show_menu(
-                chart_options,
-                title="\nChart Options:"
-            )
+            chart_index, _ = run_menu(chart_menu, chart_menu_clean_options)
             
-            # Handle ESC/q or return
-            if menu_index is None:
-                console.print("[yellow]Returning to dashboard...[/yellow]")
-                skip_key_prompt = True
+            # Handle ESC/q or return. Nothing changed, so go straight back to the
+            # dashboard without any "returning" chatter.
+            if chart_index is None:
                 continue
             
-            if selected_chart == "Summary chart: Assets over time":
-                console.print("\n[green]Generating summary net worth chart...[/green]")
-                chart_utils.generate_charts(snapshots, financial_items, categories, "summary")
-            elif selected_chart == "Detailed chart: All individual assets":
-                console.print("\n[green]Generating detailed net worth chart (all assets)...[/green]")
-                chart_utils.generate_charts(snapshots, financial_items, categories, "detailed")
-            elif selected_chart == "Category chart: Assets by category":
-                console.print("\n[green]Generating category-based net worth chart...[/green]")
-                chart_utils.generate_charts(snapshots, financial_items, categories, "category")
-            elif selected_chart == "Single asset chart: Track one asset over time":
+            pause_for_keypress = True
+            if chart_index in _CHART_DISPATCH:
+                chart_type, progress_text = _CHART_DISPATCH[chart_index]
+                console.print(progress_text)
+                chart_utils.generate_charts(snapshots, financial_items, categories, chart_type)
+            elif chart_index == _CHART_SINGLE_ASSET:
                 # Let the user select an asset to chart
                 if not financial_items:
                     console.print("[yellow]No financial items available to chart.[/yellow]")
                 else:
+                    # Create asset selection menu from financial_items. The items can't change
+                    # while charting, so the menu is built once and re-shown for each chart.
+                    item_options_with_ids = [(item['id'], item['name']) for item in financial_items]
+                    # The menu needs a list of strings for display. We'll map back to ID after selection.
+                    display_options = [f"{name} (ID: {id})" for id, name in item_options_with_ids]
+                    item_menu, item_menu_clean_options = create_menu(
+                        display_options,
+                        title="\nSelect an item to chart:",
+                        shortcuts=False # Allow selection by number
+                    )
+                    
                     # Loop to allow charting multiple assets in succession
                     while True:
-                        # Create asset selection menu from financial_items
-                        item_options_with_ids = [(item['id'], item['name']) for item in financial_items]
-                        
-                        if not item_options_with_ids:
-                            console.print("[yellow]No financial items found to select for charting.[/yellow]")
-                            break
-
-                        # show_menu needs a list of strings for display. We'll map back to ID after selection.
-                        display_options = [f"{name} (ID: {id})" for id, name in item_options_with_ids]
-                        
-                        menu_idx, selected_display_option = show_menu(
-                            display_options,
-                            title="\nSelect an item to chart:",
-                            shortcuts=False # Allow selection by number
-                        )
+                        menu_idx, _ = run_menu(item_menu, item_menu_clean_options)
                         
                         if menu_idx is None: # User pressed Esc or q
                             break
@@ -426,19 +608,18 @@ def main():
                         
                         if not Confirm.ask("\nWould you like to chart another item?", default=False):
                             break
-            elif selected_chart == "Generate all three main chart types":
-                console.print("\n[green]Generating all chart types...[/green]")
-                chart_utils.generate_charts(snapshots, financial_items, categories, "all")
-        elif selected_option == "View Categories":
+        elif menu_index == _MENU_VIEW_CATEGORIES:
             updated_categories = manage_categories_interactive(categories, financial_items, console)
             if updated_categories is not categories: # Check if the list object itself changed (or content differs)
                 categories = updated_categories
                 # Save data since categories list (which is part of the save structure) has been modified.
-                save_historical_data(console, categories, financial_items, snapshots, CURRENT_DATA_FILE)
-                save_last_opened_file(CURRENT_DATA_FILE) # Remember this file
-                console.print("[green]Category changes saved successfully.[/green]")
-            skip_key_prompt = True # Ensure we don't double-prompt for key press
-        elif selected_option == "File Options":
+                with console:
+                    save_historical_data(console, categories, financial_items, snapshots, CURRENT_DATA_FILE)
+                    save_last_opened_file(CURRENT_DATA_FILE) # Remember this file
+                    console.print(_CATEGORIES_SAVED_TEXT)
+            # Renames and deletes edit the list in place, so rebuild the summary either way
+            state_dirty = True
+        elif menu_index == _MENU_FILE_OPTIONS:
             # Call the new file_options_screen and unpack all its return values
             (categories, financial_items, snapshots, 
              current_snapshot_balances, current_date, CURRENT_DATA_FILE) = file_options_screen(
@@ -450,21 +631,14 @@ def main():
                 current_date, 
                 CURRENT_DATA_FILE
             )
-            skip_key_prompt = True # The file_options_screen handles its own prompts and flow
-        elif selected_option == "Exit Application":
-            console.print("\n[yellow]Exiting application. Goodbye![/yellow]")
-            sys.exit()
+            state_dirty = True # A different file may have been loaded or created
         
-        # Press any key to continue - skip if coming back from a submenu with its own return flow
-        if not skip_key_prompt:
-            console.print("\n[dim]Press any key to return to dashboard...[/dim]")
-            try:
-                readchar.readkey()
-            except Exception:
-                pass
+        if pause_for_keypress:
+            _print_static(_PRESS_ANY_KEY_TEXT)
+            _wait_for_keypress()
     
-    # The main function might not need to return these if they are managed globally
-    # or if the application exits from within the loop. For now, let's assume it does.
+    # Quitting breaks out of the loop rather than calling sys.exit(), so main() always
+    # returns here and the process exits normally from the __main__ block.
     return categories, financial_items, snapshots
 
 if __name__ == "__main__":
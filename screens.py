@@ -5,8 +5,20 @@ from rich.prompt import Confirm, Prompt
 from rich import box
 import readchar
 import collections # For collections.abc.Iterable
+import sys
 from datetime import datetime
+from functools import lru_cache
 from rich.panel import Panel
+from rich.style import Style
+from rich.cells import cell_len
+
+try: # POSIX terminals
+    import select
+    import termios
+    import tty
+    msvcrt = None
+except ImportError: # Windows
+    import msvcrt
 
 # Functions from other new modules
 from ui_display import display_assets
@@ -14,34 +26,105 @@ from core_logic import generate_unique_id
 from asset_utils import guess_category, view_categories, manage_categories_interactive
 from menu_utils import show_menu
 
+# Styles used on per-item and per-cell hot paths, created once so Rich never has to
+# parse a style string or markup for them.
+_GREEN = Style(color="green")
+_RED = Style(color="red")
+_CYAN = Style(color="cyan")
+_YELLOW = Style(color="yellow")
+_DIM = Style(dim=True)
+_BOLD_CYAN = Style(color="cyan", bold=True)
+_GREEN_BOLD = Style(color="green", bold=True)
+_RED_BOLD = Style(color="red", bold=True)
+_DIM_BOLD = Style(dim=True, bold=True)
+_BOLD_UNDERLINE = Style(bold=True, underline=True)
+_ITEM_SEPARATOR = Text("─" * 60, style=_DIM)
+# Change column (style, symbol), indexed by the sign of the change: 0, 1 or -1
+_CHANGE_STYLE_BY_SIGN = ((_DIM_BOLD, "→"), (_GREEN_BOLD, "↑"), (_RED_BOLD, "↓"))
+# Liquid column cells in the item management table
+_YES_TEXT = Text("Yes", style=_GREEN)
+_NO_TEXT = Text("No", style=_RED)
+# Shared cell for zero balances in the history table, where most cells are usually zero
+_ZERO_TEXT = Text("£0.00", style=_DIM)
+
+# Static text blocks printed with a single console.print each.
+# Markup is parsed once here rather than on every print.
+_BALANCE_UPDATE_HEADER = Text.from_markup(
+    "\n[bold blue]Now, let's update the balances for your financial items[/bold blue]\n"
+    + "[blue]" + "━" * 60 + "[/blue]\n"
+)
+_BALANCE_UPDATE_INSTRUCTIONS = Text.from_markup(
+    "\n[cyan]Instructions:[/cyan]\n"
+    " • Press [bold]Enter[/bold] to keep the current balance\n"
+    " • Type a [bold]new amount[/bold] to update the balance directly\n"
+    " • Type [bold]b[/bold] to go back to the previous item\n"
+    " • Type [bold]q[/bold] to finish and return to the menu\n"
+    " [yellow]Note: Changes are applied to the current session. Save from the main menu.[/yellow]\n"
+)
+
+@lru_cache(maxsize=4096)
+def _format_snapshot_date(date_str: str) -> str:
+    """Formats a YYYY-MM-DD snapshot date for display (e.g. '05 Mar 2024').
+       Memoised: strptime is slow and the same dates are formatted every time the
+       history view is opened. Unexpected formats are returned unchanged.
+    """
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%d %b %Y")
+    except ValueError:
+        return date_str
+
+@lru_cache(maxsize=4096)
+def _balance_cell(balance: float) -> Text:
+    """Balance cell for the item management table, green for zero or more and red below.
+       Memoised: the table is redrawn after every action with mostly the same balances.
+       The returned Text is shared, so it must not be modified.
+    """
+    return Text(f"£{balance:,.2f}", style=_GREEN if balance >= 0 else _RED)
+
+def _index_categories(categories: list) -> tuple[dict, dict]:
+    """Builds (by_id, by_name) lookups for the category selection prompts.
+       Names are casefolded for case-insensitive matching; the first category
+       with a given name wins, as a linear search would.
+    """
+    by_id = {cat['id']: cat for cat in categories}
+    by_name = {}
+    for cat in categories:
+        by_name.setdefault(cat.get('name', '').casefold(), cat)
+    return by_id, by_name
+
+def _index_new_category(category: dict, by_id: dict, by_name: dict):
+    """Adds a newly created category to lookups built by _index_categories."""
+    by_id[category['id']] = category
+    by_name.setdefault(category['name'].casefold(), category)
+
 def get_asset_balances(console: Console, snapshot_balances: collections.abc.Iterable, financial_items: collections.abc.Iterable, categories_list: collections.abc.Iterable):
-    """Iterates through snapshot balances and prompts the user for their new balances, allowing skips."""
+    """Iterates through snapshot balances and prompts the user for their new balances, allowing skips.
+       Returns True if balances were changed and confirmed, False if the user discarded
+       their changes, and None if nothing was edited (so there is nothing to save).
+    """
     if not snapshot_balances:
         console.print("[yellow]No balances to update in the current snapshot.[/yellow]")
-        return True
+        return None # Nothing to update
 
-    console.print("\n[bold blue]Now, let's update the balances for your financial items[/bold blue]")
-    console.print("━" * 60, style="blue")
-    console.print()
+    console.print(_BALANCE_UPDATE_HEADER)
 
     items_dict = {item['id']: item for item in financial_items}
     cats_dict = {cat['id']: cat for cat in categories_list}
 
-    display_assets(console, snapshot_balances, financial_items, categories_list, table_title="Current Financial Snapshot Overview")
-    console.print()
-    console.print("[cyan]Instructions:[/cyan]")
-    console.print(" • Press [bold]Enter[/bold] to keep the current balance")
-    console.print(" • Type a [bold]new amount[/bold] to update the balance directly")
-    console.print(" • Type [bold]b[/bold] to go back to the previous item")
-    console.print(" • Type [bold]q[/bold] to finish and return to the menu")
-    console.print(" [yellow]Note: Changes are applied to the current session. Save from the main menu.[/yellow]")
-    console.print()
+    display_assets(
+        console, snapshot_balances, financial_items, categories_list,
+        table_title="Current Financial Snapshot Overview",
+        items_by_id=items_dict, cats_by_id=cats_dict
+    )
+    console.print(_BALANCE_UPDATE_INSTRUCTIONS)
     
     modified_balance_entries = []
+    modified_item_ids = set() # item_ids already in modified_balance_entries
     
     current_idx = 0
-    # Ensure snapshot_balances is a list for indexing
-    snapshot_balances_list = list(snapshot_balances) 
+    # Ensure snapshot_balances is a list for indexing; callers almost always pass one
+    # already, so only other iterables are copied
+    snapshot_balances_list = snapshot_balances if isinstance(snapshot_balances, list) else list(snapshot_balances)
 
     while current_idx < len(snapshot_balances_list):
         balance_entry = snapshot_balances_list[current_idx]
@@ -60,14 +143,23 @@ def get_asset_balances(console: Console, snapshot_balances: collections.abc.Iter
         category_name = category_details.get("name", "Uncategorized") if category_details else "Invalid Category"
         is_liquid = item_details.get("liquid", False)
         
-        console.print(f"[bold cyan]Item {current_idx + 1} of {len(snapshot_balances_list)}:[/bold cyan] [cyan]{item_name}[/cyan]")
-        console.print(f"Current balance: [{'green' if current_balance >= 0 else 'red'}]£{current_balance:,.2f}[/{'green' if current_balance >= 0 else 'red'}]")
-        console.print(f"Category: [yellow]{category_name}[/yellow] | Liquid: [{'green' if is_liquid else 'red'}]{('Yes' if is_liquid else 'No')}[/{'green' if is_liquid else 'red'}]")
+        # Build the item's header as one Text so it is a single print with no markup to parse
+        item_header = Text()
+        item_header.append(f"Item {current_idx + 1} of {len(snapshot_balances_list)}:", style=_BOLD_CYAN)
+        item_header.append(" ")
+        item_header.append(item_name, style=_CYAN)
+        item_header.append("\nCurrent balance: ")
+        item_header.append(f"£{current_balance:,.2f}", style=_GREEN if current_balance >= 0 else _RED)
+        item_header.append("\nCategory: ")
+        item_header.append(category_name, style=_YELLOW)
+        item_header.append(" | Liquid: ")
+        item_header.append("Yes" if is_liquid else "No", style=_GREEN if is_liquid else _RED)
+        console.print(item_header)
         
         user_input = console.input("\nEnter new balance (or Enter to keep current): ").strip()
         
         if not user_input:
-            console.print(f"[green]Keeping current balance for {item_name}: £{current_balance:,.2f}[/green]")
+            console.print(Text(f"Keeping current balance for {item_name}: £{current_balance:,.2f}", style=_GREEN))
             current_idx += 1
         elif user_input.lower() == 'q':
             if modified_balance_entries:
@@ -80,7 +172,7 @@ def get_asset_balances(console: Console, snapshot_balances: collections.abc.Iter
                     return False 
             else:
                 console.print("[yellow]Finished without making any changes.[/yellow]")
-                return True
+                return None # Nothing was edited
         elif user_input.lower() == 'b' and current_idx > 0:
             current_idx -= 1
             console.print("[yellow]Going back to previous item.[/yellow]")
@@ -88,22 +180,33 @@ def get_asset_balances(console: Console, snapshot_balances: collections.abc.Iter
             try:
                 new_balance = float(user_input)
                 balance_entry['balance'] = new_balance
-                console.print(f"Balance for '{item_name}' updated to [{'green' if new_balance >= 0 else 'red'}]£{new_balance:,.2f}[/{'green' if new_balance >= 0 else 'red'}]")
-                if item_id not in [me["item_id"] for me in modified_balance_entries]:
+                console.print(Text.assemble(
+                    f"Balance for '{item_name}' updated to ",
+                    (f"£{new_balance:,.2f}", _GREEN if new_balance >= 0 else _RED)
+                ))
+                if item_id not in modified_item_ids:
+                    modified_item_ids.add(item_id)
                     modified_balance_entries.append({"item_id": item_id, "name": item_name, "new_balance": new_balance})
                 current_idx += 1
             except ValueError:
                 console.print("[red]Invalid input. Please enter a number, 'b' to go back, or 'q' to finish.[/red]")
         
-        console.print("─" * 60, style="dim")
+        console.print(_ITEM_SEPARATOR)
     
     if modified_balance_entries:
-        console.print("\n[bold green]Summary of Updated Balances for this Session:[/bold green]")
+        # Assemble the whole summary as one Text: a single print, no markup to parse
+        summary = Text("\n")
+        summary.append("Summary of Updated Balances for this Session:\n", style=_GREEN_BOLD)
         for entry_summary in modified_balance_entries:
-            console.print(f"• [cyan]{entry_summary['name']}[/cyan]: [{'green' if entry_summary['new_balance'] >= 0 else 'red'}]£{entry_summary['new_balance']:,.2f}[/{'green' if entry_summary['new_balance'] >= 0 else 'red'}]")
-        console.print("\n[green]Balance updates applied to current session.[/green]")
+            summary.append("• ")
+            summary.append(entry_summary['name'], style=_CYAN)
+            summary.append(": ")
+            summary.append(f"£{entry_summary['new_balance']:,.2f}\n", style=_GREEN if entry_summary['new_balance'] >= 0 else _RED)
+        summary.append("\nBalance updates applied to current session.", style=_GREEN)
+        console.print(summary)
     else:
         console.print("\n[yellow]No changes were made to any balances.[/yellow]")
+        return None # Nothing was edited
     
     return True
 
@@ -115,12 +218,15 @@ def add_new_financial_item_interactive(console_instance: Console, financial_item
     """
     console_instance.print("\n[bold blue]Adding a New Financial Item[/bold blue]")
 
+    # Lowercased names of existing items, built once for the uniqueness check on each retry
+    existing_names_lower = {item.get('name', '').lower() for item in financial_items_list}
+
     while True:
         name = console_instance.input("Enter the name for the new financial item: ").strip()
         if not name:
             console_instance.print("[red]Item name cannot be empty.[/red]")
             continue
-        if any(item.get('name', '').lower() == name.lower() for item in financial_items_list):
+        if name.lower() in existing_names_lower:
             console_instance.print(f"[red]An item with the name '{name}' already exists. Please use a unique name.[/red]")
         else:
             break
@@ -135,10 +241,12 @@ def add_new_financial_item_interactive(console_instance: Console, financial_item
 
     console_instance.print("\n[bold]Select or Create a Category:[/bold]")
     
+    cats_by_id, cats_by_name = _index_categories(categories_list)
+
     guessed_category_id = guess_category(name, categories_list)
     guessed_cat_obj = None
     if guessed_category_id:
-        guessed_cat_obj = next((cat for cat in categories_list if cat['id'] == guessed_category_id), None)
+        guessed_cat_obj = cats_by_id.get(guessed_category_id)
         if guessed_cat_obj:
             console_instance.print(f"Suggested category based on name: [green]'{guessed_cat_obj['name']}'[/green] (ID: {guessed_category_id})")
         else: 
@@ -168,14 +276,14 @@ def add_new_financial_item_interactive(console_instance: Console, financial_item
              console_instance.print("[red]Category choice cannot be empty if no suggestion is available/accepted.[/red]")
              continue
 
-        selected_cat_by_id = next((cat for cat in categories_list if cat.get('id') == cat_choice), None)
+        selected_cat_by_id = cats_by_id.get(cat_choice)
         if selected_cat_by_id:
             chosen_category_id = selected_cat_by_id['id']
             console_instance.print(f"Selected category by ID: '{selected_cat_by_id['name']}'")
             break
         
         new_category_name_potential = cat_choice
-        existing_cat_by_name = next((cat for cat in categories_list if cat.get('name','').lower() == new_category_name_potential.lower()), None)
+        existing_cat_by_name = cats_by_name.get(new_category_name_potential.casefold())
         
         if existing_cat_by_name:
             if Confirm.ask(f"A category named '{existing_cat_by_name['name']}' (ID: {existing_cat_by_name['id']}) already exists. Use this one?", console=console_instance):
@@ -191,7 +299,7 @@ def add_new_financial_item_interactive(console_instance: Console, financial_item
                 keywords_str = Prompt.ask(f"Enter keywords for '{new_category_name_potential}' (comma-separated)", default="", console=console_instance)
                 new_keywords = sorted(list(set(k.strip().lower() for k in keywords_str.split(',') if k.strip())))
                 
-                new_cat_id_val = generate_unique_id([cat['id'] for cat in categories_list])
+                new_cat_id_val = generate_unique_id(cats_by_id)
                 categories_list.append({'id': new_cat_id_val, 'name': new_category_name_potential, 'keywords': new_keywords})
                 chosen_category_id = new_cat_id_val
                 console_instance.print(f"New category '{new_category_name_potential}' created with ID {chosen_category_id} and keywords: {', '.join(new_keywords) or 'None'}.")
@@ -208,7 +316,7 @@ def add_new_financial_item_interactive(console_instance: Console, financial_item
         except ValueError:
             console_instance.print("[red]Invalid balance. Please enter a numeric value.[/red]")
 
-    new_item_id = generate_unique_id([item['id'] for item in financial_items_list])
+    new_item_id = generate_unique_id(item['id'] for item in financial_items_list)
 
     new_item = {
         'id': new_item_id,
@@ -264,23 +372,38 @@ def manage_financial_item_interactive(
         console.print(f"[yellow]No balance entry found for '{item_details['name']}' on {current_date}. Initializing with £0.00.[/yellow]")
         changes_made = True # Adding a balance entry is a change
 
+    # Category lookups by id and by name, kept in step when a new category is created below
+    cats_by_id, cats_by_name = _index_categories(categories)
+
+    # The screen is only cleared and the status block reprinted when the item changed;
+    # otherwise the menu is simply shown again below the last action's output.
+    status_dirty = True
+
     while True:
-        console.clear()
         # Refresh details in case of rename
         item_name_display = item_details['name']
         item_type_display = item_details['type']
         item_liquid_display = item_details['liquid']
-        
-        category_details = next((cat for cat in categories if cat['id'] == item_details['category_id']), None)
-        category_name_display = category_details['name'] if category_details else "Uncategorized"
-        
         current_balance_display = balance_entry['balance']
 
-        console.print(f"\n[bold underline]Managing: {item_name_display}[/bold underline] (ID: {item_id_to_manage})")
-        console.print(f"Type: [cyan]{item_type_display.capitalize()}[/cyan]")
-        console.print(f"Balance for {current_date}: [{'green' if current_balance_display >= 0 else 'red'}]£{current_balance_display:,.2f}[/{'green' if current_balance_display >= 0 else 'red'}]")
-        console.print(f"Category: [yellow]{category_name_display}[/yellow] (ID: {item_details['category_id']})")
-        console.print(f"Liquidity: [{'green' if item_liquid_display else 'red'}]{('Yes' if item_liquid_display else 'No')}[/{'green' if item_liquid_display else 'red'}]")
+        if status_dirty:
+            console.clear()
+            category_details = cats_by_id.get(item_details['category_id'])
+            category_name_display = category_details['name'] if category_details else "Uncategorized"
+
+            # The status block is built as one Text and printed once
+            item_status = Text("\n")
+            item_status.append(f"Managing: {item_name_display}", style=_BOLD_UNDERLINE)
+            item_status.append(f" (ID: {item_id_to_manage})\nType: ")
+            item_status.append(item_type_display.capitalize(), style=_CYAN)
+            item_status.append(f"\nBalance for {current_date}: ")
+            item_status.append(f"£{current_balance_display:,.2f}", style=_GREEN if current_balance_display >= 0 else _RED)
+            item_status.append("\nCategory: ")
+            item_status.append(category_name_display, style=_YELLOW)
+            item_status.append(f" (ID: {item_details['category_id']})\nLiquidity: ")
+            item_status.append("Yes" if item_liquid_display else "No", style=_GREEN if item_liquid_display else _RED)
+            console.print(item_status)
+            status_dirty = False
         
         menu_options = [
             "Update Balance for Current Date",
@@ -306,7 +429,7 @@ def manage_financial_item_interactive(
                 if balance_entry['balance'] != new_balance:
                     balance_entry['balance'] = new_balance
                     console.print(f"[green]Balance updated to £{new_balance:,.2f}[/green]")
-                    changes_made = True
+                    changes_made = status_dirty = True
                 else:
                     console.print("[yellow]Balance unchanged.[/yellow]")
             except ValueError:
@@ -316,12 +439,12 @@ def manage_financial_item_interactive(
             new_name = Prompt.ask("Enter new name", default=item_details['name'], console=console).strip()
             if not new_name:
                 console.print("[red]Name cannot be empty.[/red]")
-            elif any(item['name'].lower() == new_name.lower() and item['id'] != item_id_to_manage for item in financial_items):
+            elif new_name.lower() in {item['name'].lower() for item in financial_items if item['id'] != item_id_to_manage}:
                 console.print(f"[red]An item named '{new_name}' already exists.[/red]")
             elif item_details['name'] != new_name:
                 item_details['name'] = new_name
                 console.print(f"[green]Item name updated to '{new_name}'.[/green]")
-                changes_made = True
+                changes_made = status_dirty = True
             else:
                 console.print("[yellow]Name unchanged.[/yellow]")
 
@@ -330,7 +453,7 @@ def manage_financial_item_interactive(
             view_categories(categories, console)
             
             current_category_id = item_details['category_id']
-            current_category_details = next((cat for cat in categories if cat['id'] == current_category_id), None)
+            current_category_details = cats_by_id.get(current_category_id)
             current_category_name = current_category_details['name'] if current_category_details else "None"
             console.print(f"Current category for '{item_details['name']}': [yellow]{current_category_name}[/yellow] (ID: {current_category_id})")
 
@@ -345,7 +468,7 @@ def manage_financial_item_interactive(
                     console.print("[yellow]No change made. Category remains '{current_category_name}'.[/yellow]")
                     break 
 
-                selected_cat_by_id = next((cat for cat in categories if cat.get('id') == cat_choice), None)
+                selected_cat_by_id = cats_by_id.get(cat_choice)
                 if selected_cat_by_id:
                     if selected_cat_by_id['id'] == current_category_id:
                         console.print(f"[yellow]Item is already in category '{selected_cat_by_id['name']}'. No change made.[/yellow]")
@@ -355,7 +478,7 @@ def manage_financial_item_interactive(
                     if Confirm.ask(f"Change category to '{selected_cat_by_id['name']}' (ID: {selected_cat_by_id['id']})?", console=console):
                         chosen_category_id = selected_cat_by_id['id']
                         item_details['category_id'] = chosen_category_id
-                        changes_made = True
+                        changes_made = status_dirty = True
                         console.print(f"[green]Category changed to '{selected_cat_by_id['name']}'.[/green]")
                     else:
                         console.print("[yellow]Category change cancelled.[/yellow]")
@@ -363,7 +486,7 @@ def manage_financial_item_interactive(
                 
                 # If not an ID, treat as a new category name or existing name
                 new_category_name_potential = cat_choice
-                existing_cat_by_name = next((cat for cat in categories if cat.get('name','').lower() == new_category_name_potential.lower()), None)
+                existing_cat_by_name = cats_by_name.get(new_category_name_potential.casefold())
                 
                 if existing_cat_by_name:
                     if existing_cat_by_name['id'] == current_category_id:
@@ -373,7 +496,7 @@ def manage_financial_item_interactive(
                     if Confirm.ask(f"A category named '{existing_cat_by_name['name']}' (ID: {existing_cat_by_name['id']}) already exists. Use this one?", console=console):
                         chosen_category_id = existing_cat_by_name['id']
                         item_details['category_id'] = chosen_category_id
-                        changes_made = True
+                        changes_made = status_dirty = True
                         console.print(f"[green]Category changed to '{existing_cat_by_name['name']}'.[/green]")
                         break
                     else:
@@ -385,11 +508,12 @@ def manage_financial_item_interactive(
                         keywords_str = Prompt.ask(f"Enter keywords for '{new_category_name_potential}' (comma-separated)", default="", console=console)
                         new_keywords = sorted(list(set(k.strip().lower() for k in keywords_str.split(',') if k.strip())))
                         
-                        new_cat_id_val = generate_unique_id([cat['id'] for cat in categories])
+                        new_cat_id_val = generate_unique_id(cats_by_id)
                         categories.append({'id': new_cat_id_val, 'name': new_category_name_potential, 'keywords': new_keywords})
+                        _index_new_category(categories[-1], cats_by_id, cats_by_name)
                         chosen_category_id = new_cat_id_val
                         item_details['category_id'] = chosen_category_id
-                        changes_made = True
+                        changes_made = status_dirty = True
                         console.print(f"[green]New category '{new_category_name_potential}' created and item assigned to it.[/green]")
                         break
                     else:
@@ -401,7 +525,7 @@ def manage_financial_item_interactive(
         elif choice_str == "Toggle Liquidity":
             item_details['liquid'] = not item_details['liquid']
             console.print(f"[green]Liquidity toggled to: {'Yes' if item_details['liquid'] else 'No'}[/green]")
-            changes_made = True
+            changes_made = status_dirty = True
         
         elif choice_str == "Toggle Item Type (Asset/Liability)":
             current_type = item_details['type']
@@ -409,7 +533,7 @@ def manage_financial_item_interactive(
             if Confirm.ask(f"Change item type from '{current_type}' to '{new_type}'?", console=console):
                 item_details['type'] = new_type
                 console.print(f"[green]Item type changed to '{new_type}'.[/green]")
-                changes_made = True
+                changes_made = status_dirty = True
             else:
                 console.print("[yellow]Item type unchanged.[/yellow]")
 
@@ -427,11 +551,16 @@ def manage_financial_item_interactive(
                 if balance_entry_idx_current != -1:
                     current_snapshot_balances.pop(balance_entry_idx_current)
 
-                # 3. Remove from ALL snapshots in the main snapshots list
+                # 3. Remove from ALL snapshots in the main snapshots list. Most snapshots
+                # may not hold the item, so a list is only rebuilt when it actually does.
                 for snapshot in snapshots:
-                    snapshot['balances'] = [bal for bal in snapshot.get('balances', []) if bal.get('item_id') != deleted_item_id]
+                    snapshot_balances = snapshot.get('balances')
+                    if not snapshot_balances:
+                        continue
+                    if any(bal.get('item_id') == deleted_item_id for bal in snapshot_balances):
+                        snapshot['balances'] = [bal for bal in snapshot_balances if bal.get('item_id') != deleted_item_id]
                 
-                changes_made = True
+                changes_made = status_dirty = True
                 console.print(f"[green]Financial item '{item_name_to_delete}' (ID: {deleted_item_id}) and all its associated data have been deleted.[/green]")
                 # 4. Return immediately as item_id_to_manage is no longer valid.
                 return financial_items, categories, snapshots, current_snapshot_balances, True
@@ -440,10 +569,72 @@ def manage_financial_item_interactive(
         
         # Use choice_str for the pause condition. If item_action_idx was None, choice_str is "", so this won't run.
         if choice_str and choice_str not in ["Change Category", "Delete Financial Item (Globally!)"]: 
-            Prompt.ask("\nPress Enter to continue...", default="", show_default=False, console=console)
+            console.input("\nPress Enter to continue...")
 
     return financial_items, categories, snapshots, current_snapshot_balances, changes_made
 
+def _wrap_history_header(col_name: str, max_header_len: int) -> Text:
+    """Word-wraps a history table column name to at most 2 lines of max_header_len,
+       ending with '...' if the name needs more lines than that.
+    """
+    # Rich's Text.wrap is for single lines. For multi-line truncation:
+    wrapped_header_lines = []
+    current_line = ""
+    temp_lines = []
+    for word in col_name.split():
+        # Column names are plain text, so their width is just their cell length
+        if cell_len(current_line + word) < max_header_len:
+            current_line += word + " "
+        else:
+            if current_line: temp_lines.append(current_line.strip())
+            current_line = word + " "
+    if current_line: temp_lines.append(current_line.strip())
+
+    for i, line_text in enumerate(temp_lines):
+        if i < 2: # Max 2 lines for header
+            wrapped_header_lines.append(Text(line_text))
+        elif i == 2: # Add ellipsis if more lines
+            if len(temp_lines) > 2:
+                 wrapped_header_lines[-1] = Text(str(wrapped_header_lines[-1])[:max_header_len-3] + "...", overflow="ellipsis")
+            break
+
+    return Text("\n").join(wrapped_header_lines) if wrapped_header_lines else Text(col_name, overflow="ellipsis", width=max_header_len)
+
+def _key_waiting() -> bool:
+    """Returns True if another key press is already waiting to be read, without reading it."""
+    if msvcrt is not None:
+        return msvcrt.kbhit()
+    try:
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+    except (ValueError, OSError, termios.error): # Not a terminal
+        return False
+    try:
+        # Typed keys only become readable outside canonical mode. TCSANOW keeps them queued.
+        tty.setcbreak(fd, termios.TCSANOW)
+        return bool(select.select([fd], [], [], 0)[0])
+    finally:
+        termios.tcsetattr(fd, termios.TCSANOW, old_attrs)
+
+def _history_cols_per_page(console_width: int, date_col_content_width: int, cell_horizontal_padding: int,
+                           scrollable_content_width: int, num_scrollable_columns: int) -> int:
+    """Returns how many uniform-width scrollable columns fit beside the fixed Date column."""
+    padded_date_col_total_width = date_col_content_width + 2 * cell_horizontal_padding
+    width_consumed_by_fixed_date_and_structure = padded_date_col_total_width + 3 
+    available_width_for_scrollable_section = console_width - width_consumed_by_fixed_date_and_structure
+    
+    cost_per_scrollable_col_and_its_separator = (scrollable_content_width + 2 * cell_horizontal_padding) + 1
+
+    num_scrollable_cols_on_page = 0
+    if available_width_for_scrollable_section > (scrollable_content_width + 2 * cell_horizontal_padding):
+        num_scrollable_cols_on_page = max(1, available_width_for_scrollable_section // cost_per_scrollable_col_and_its_separator)
+    elif num_scrollable_columns > 0 :
+         num_scrollable_cols_on_page = 1
+    return num_scrollable_cols_on_page
+
+# (item names tuple, sorted unique names) from the last history table build
+_history_columns_cache = None
+
 def view_historical_snapshots_table(console: Console, snapshots: list, financial_items: list, categories: list):
     """
     Displays a pivot table with 'Date' fixed left. Other columns (items, TNW, Change)
@@ -463,7 +654,15 @@ def view_historical_snapshots_table(console: Console, snapshots: list, financial
     # Get all unique financial item names, sorted, to be used as columns
     # Ensure we only pick items that actually appear in snapshots to avoid empty columns,
     # or list all known financial_items. For now, list all known, sorted by name.
-    item_names_as_cols = sorted(list(set(item['name'] for item in financial_items)))
+    # The sorted column list is reused while the item names are unchanged (e.g. when the
+    # view is reopened). The key is the names themselves, so renames are picked up.
+    global _history_columns_cache
+    item_names_key = tuple(item['name'] for item in financial_items)
+    if _history_columns_cache is not None and _history_columns_cache[0] == item_names_key:
+        item_names_as_cols = _history_columns_cache[1]
+    else:
+        item_names_as_cols = sorted(set(item_names_key))
+        _history_columns_cache = (item_names_key, item_names_as_cols)
 
     if not item_names_as_cols:
         console.print("[yellow]No financial items found to display as columns.[/yellow]")
@@ -476,7 +675,10 @@ def view_historical_snapshots_table(console: Console, snapshots: list, financial
     date_col_content_width = 12
 
     # --- Prepare full data for display ---
-    processed_rows = []
+    # Cells are laid out straight into rows in scrollable_column_names order (item columns,
+    # then TNW and Change), with the fixed Date cells kept alongside
+    date_cells = []
+    cell_matrix = []
     # csv_export_rows = [] # CSV export can be a separate step if needed
     # csv_headers = [date_col_name] + scrollable_column_names
     # csv_export_rows.append(csv_headers)
@@ -487,160 +689,163 @@ def view_historical_snapshots_table(console: Console, snapshots: list, financial
     previous_tnw_for_change_calc = None
     max_scrollable_content_len = 0
 
+    # Column name -> item_id, built once instead of searching financial_items per cell.
+    # Reversed so the first item with a given name wins, as the linear search did.
+    name_to_id = {item['name']: item['id'] for item in reversed(financial_items)}
+    # The item_id behind each column, in column order
+    col_item_ids = [name_to_id[item_name_col] for item_name_col in item_names_as_cols]
+
     for snapshot in sorted_snapshots:
         date_str = snapshot['date']
-        row_display_data = {}
+        row_cells = []
         # row_csv_data = [date_str]
-        try:
-            row_display_data[date_col_name] = Text(datetime.strptime(date_str, "%Y-%m-%d").strftime("%d %b %Y"), style="dim")
-        except ValueError: # Fallback if date format is unexpected
-            row_display_data[date_col_name] = Text(date_str, style="dim")
+        date_cells.append(Text(_format_snapshot_date(date_str), style=_DIM))
 
         balances_for_current_snapshot = {bal['item_id']: bal['balance'] for bal in snapshot.get('balances', [])}
-        current_tnw_for_this_date = 0
-
-        for item_name_col in item_names_as_cols:
-            # Find the item_id for this item_name_col
-            item_id_for_col = next((item['id'] for item in financial_items if item['name'] == item_name_col), None)
-            balance = 0.0 # Default to 0.0 if item not in this snapshot or item_id not found
-            if item_id_for_col and item_id_for_col in balances_for_current_snapshot:
-                balance = balances_for_current_snapshot[item_id_for_col]
-            
-            current_tnw_for_this_date += balance # Sum all balances for TNW
-            
-            style = "green" if balance >= 0 else "red"
-            text_val = Text(f"£{balance:,.2f}", style=style if balance != 0.0 else "dim") # Dim for zero balances
-            row_display_data[item_name_col] = text_val
-            max_scrollable_content_len = max(max_scrollable_content_len, len(str(text_val)))
+        # TNW comes straight from the snapshot's own balances (known items only), so
+        # the column loop below doesn't add up the zeros for items it doesn't hold.
+        # Usually every item in a snapshot is known, and a key-view subset check lets
+        # the sum run over the values directly instead of through a filtering generator.
+        if balances_for_current_snapshot.keys() <= items_dict.keys():
+            current_tnw_for_this_date = sum(balances_for_current_snapshot.values())
+        else:
+            current_tnw_for_this_date = sum(
+                balance for item_id, balance in balances_for_current_snapshot.items() if item_id in items_dict
+            )
+
+        # Pull the row's numbers out in one comprehension (0.0 if the item isn't in this
+        # snapshot), leaving the loop below to do only the styling
+        row_balances = [balances_for_current_snapshot.get(item_id, 0.0) for item_id in col_item_ids]
+
+        for balance in row_balances:
+            if balance == 0.0:
+                # Zero cells all share one dim Text; its width is below the minimum column width
+                row_cells.append(_ZERO_TEXT)
+                continue
+            balance_str = f"£{balance:,.2f}"
+            row_cells.append(Text(balance_str, style=_GREEN if balance > 0 else _RED))
+            # Measure the plain string; it is exactly the cell's text
+            max_scrollable_content_len = max(max_scrollable_content_len, len(balance_str))
             # row_csv_data.append(f"{balance:.2f}")
 
         # Total Net Worth
-        tnw_style = "green bold" if current_tnw_for_this_date >= 0 else "red bold"
-        tnw_text_val = Text(f"£{current_tnw_for_this_date:,.2f}", style=tnw_style)
-        row_display_data[tnw_col_name] = tnw_text_val
-        max_scrollable_content_len = max(max_scrollable_content_len, len(str(tnw_text_val)))
+        tnw_style = _GREEN_BOLD if current_tnw_for_this_date >= 0 else _RED_BOLD
+        tnw_str = f"£{current_tnw_for_this_date:,.2f}"
+        row_cells.append(Text(tnw_str, style=tnw_style))
+        max_scrollable_content_len = max(max_scrollable_content_len, len(tnw_str))
         # row_csv_data.append(f"{current_tnw_for_this_date:.2f}")
 
         # Change in Total Net Worth
-        change_display_text = Text("N/A", style="dim bold")
         # change_csv_val = "N/A"
-        if previous_tnw_for_change_calc is not None:
+        if previous_tnw_for_change_calc is None: # Oldest date, nothing to compare with
+            change_display_text = Text("N/A", style=_DIM_BOLD)
+        else:
             diff = current_tnw_for_this_date - previous_tnw_for_change_calc
+            ch_style, symbol = _CHANGE_STYLE_BY_SIGN[(diff > 0) - (diff < 0)]
             if previous_tnw_for_change_calc == 0: # Avoid division by zero
-                if diff == 0:
-                    percentage_change = 0.0
-                    ch_style = "dim bold"
-                    symbol = "→"
-                else: # Infinite change
-                    percentage_change = float('inf') if diff > 0 else float('-inf')
-                    ch_style = "green bold" if diff > 0 else "red bold"
-                    symbol = "↑" if diff > 0 else "↓"
-                change_display_text = Text(f"{symbol} {percentage_change:.2f}%" if percentage_change != float('inf') and percentage_change != float('-inf') else f"{symbol} N/A", style=ch_style)
+                # No change shows 0.00%; any change from zero is infinite, shown as N/A
+                change_display_text = Text(f"{symbol} 0.00%" if diff == 0 else f"{symbol} N/A", style=ch_style)
             else:
                 percentage_change = (diff / abs(previous_tnw_for_change_calc)) * 100
-                ch_style = "green bold" if diff > 0 else "red bold" if diff < 0 else "dim bold"
-                symbol = "↑" if diff > 0 else "↓" if diff < 0 else "→"
                 change_display_text = Text(f"{symbol} {percentage_change:.2f}%", style=ch_style)
             # change_csv_val = f"{percentage_change:.2f}%" if previous_tnw_for_change_calc != 0 else "N/A"
         
-        row_display_data[change_col_name] = change_display_text
-        max_scrollable_content_len = max(max_scrollable_content_len, len(str(change_display_text)))
+        row_cells.append(change_display_text)
+        max_scrollable_content_len = max(max_scrollable_content_len, len(change_display_text.plain))
         # row_csv_data.append(change_csv_val)
         
         previous_tnw_for_change_calc = current_tnw_for_this_date
-        processed_rows.append(row_display_data)
+        cell_matrix.append(row_cells)
         # csv_export_rows.append(row_csv_data)
     
     uniform_scrollable_content_width = max(max_scrollable_content_len, 10) # Min content width of 10
 
+    # Headers and cells don't change while scrolling, so lay them out once here and
+    # have each page take a slice
+    scrollable_headers = [
+        _wrap_history_header(col_name, uniform_scrollable_content_width)
+        for col_name in scrollable_column_names
+    ]
+
     # --- Scrolling and Table Rendering Loop ---
     current_page_start_idx = 0
+    redraw = True
+    layout_width = None # console.width that num_scrollable_cols_on_page was computed for
     while True:
-        console.clear()
-        padded_date_col_total_width = date_col_content_width + 2 * cell_horizontal_padding
-        width_consumed_by_fixed_date_and_structure = padded_date_col_total_width + 3 
-        available_width_for_scrollable_section = console.width - width_consumed_by_fixed_date_and_structure
+        # Redraw only after the page moves; other keys leave the screen as it is
+        if redraw:
+            console.clear()
+            # Read the width once per frame, so the page size and the table agree on it
+            # even if the terminal is resized mid-draw
+            frame_width = console.width
+            # The page size only depends on the terminal width, so it is worked out again
+            # only when the terminal has been resized
+            if frame_width != layout_width:
+                layout_width = frame_width
+                num_scrollable_cols_on_page = _history_cols_per_page(
+                    layout_width, date_col_content_width, cell_horizontal_padding,
+                    uniform_scrollable_content_width, len(scrollable_column_names)
+                )
+                # Furthest right a page can start while still being full
+                max_page_start_idx = max(0, len(scrollable_column_names) - num_scrollable_cols_on_page)
         
-        cost_per_scrollable_col_and_its_separator = (uniform_scrollable_content_width + 2 * cell_horizontal_padding) + 1
+            page_end_idx = min(current_page_start_idx + num_scrollable_cols_on_page, len(scrollable_column_names))
+            page_cols = slice(current_page_start_idx, page_end_idx)
 
-        num_scrollable_cols_on_page = 0
-        if available_width_for_scrollable_section > (uniform_scrollable_content_width + 2 * cell_horizontal_padding):
-            num_scrollable_cols_on_page = max(1, available_width_for_scrollable_section // cost_per_scrollable_col_and_its_separator)
-        elif len(scrollable_column_names) > 0 :
-             num_scrollable_cols_on_page = 1
-        
-        page_end_idx = min(current_page_start_idx + num_scrollable_cols_on_page, len(scrollable_column_names))
-        scrollable_cols_this_page = scrollable_column_names[current_page_start_idx:page_end_idx]
-
-        table = Table(
-            title=Text("Historical Snapshot Data (Scrollable)", style="bold blue"),
-            show_header=True, header_style="bold magenta", box=box.ROUNDED,
-            width=console.width # Make table use full console width
-        )
-
-        table.add_column(date_col_name, min_width=date_col_content_width, style="dim") # Date column style
-
-        for col_name in scrollable_cols_this_page:
-            header_text_obj = Text(col_name) # Convert to Text for wrapping
-            # Rich's Text.wrap is for single lines. For multi-line truncation:
-            wrapped_header_lines = []
-            # Simple truncation for header if too long for uniform_scrollable_content_width
-            # A more sophisticated approach might wrap then truncate.
-            max_header_len = uniform_scrollable_content_width
-            
-            current_line = ""
-            temp_lines = []
-            for word in col_name.split():
-                if console.measure(current_line + word).maximum < max_header_len:
-                    current_line += word + " "
-                else:
-                    if current_line: temp_lines.append(current_line.strip())
-                    current_line = word + " "
-            if current_line: temp_lines.append(current_line.strip())
+            table = Table(
+                title=Text("Historical Snapshot Data (Scrollable)", style="bold blue"),
+                show_header=True, header_style="bold magenta", box=box.ROUNDED,
+                width=frame_width # Make table use full console width
+            )
 
-            for i, line_text in enumerate(temp_lines):
-                if i < 2: # Max 2 lines for header
-                    wrapped_header_lines.append(Text(line_text))
-                elif i == 2: # Add ellipsis if more lines
-                    if len(temp_lines) > 2:
-                         wrapped_header_lines[-1] = Text(str(wrapped_header_lines[-1])[:max_header_len-3] + "...", overflow="ellipsis")
-                    break
-            
-            actual_header = Text("\n").join(wrapped_header_lines) if wrapped_header_lines else Text(col_name, overflow="ellipsis", width=max_header_len)
-            table.add_column(actual_header, justify="right", min_width=uniform_scrollable_content_width, width=uniform_scrollable_content_width)
+            table.add_column(date_col_name, min_width=date_col_content_width, style="dim") # Date column style
+
+            for actual_header in scrollable_headers[page_cols]:
+                table.add_column(actual_header, justify="right", min_width=uniform_scrollable_content_width, width=uniform_scrollable_content_width)
         
-        for row_data_map in processed_rows:
-            display_row_values = [row_data_map[date_col_name]]
-            for col_name in scrollable_cols_this_page:
-                display_row_values.append(row_data_map.get(col_name, Text("-", style="dim")))
-            table.add_row(*display_row_values)
+            for date_cell, row_cells in zip(date_cells, cell_matrix):
+                table.add_row(date_cell, *row_cells[page_cols])
         
-        console.print(table)
+            console.print(table)
 
-        scroll_indicator = ""
-        if current_page_start_idx > 0:
-            scroll_indicator += "[cyan]< Left (l)[/cyan]  "
-        if page_end_idx < len(scrollable_column_names):
-            scroll_indicator += "[cyan]Right (r) >[/cyan]"
+            scroll_indicator = ""
+            if current_page_start_idx > 0:
+                scroll_indicator += "[cyan]< Left (l)[/cyan]  "
+            if page_end_idx < len(scrollable_column_names):
+                scroll_indicator += "[cyan]Right (r) >[/cyan]"
         
-        # console.print(f"\n[bold]Options:[/bold] {scroll_indicator}  Press [cyan]c[/cyan] to export, [cyan]q[/cyan] to return.")
-        # Temporarily removing CSV export from this view as export_pivot_data_to_csv is not defined here
-        console.print(f"\n[bold]Options:[/bold] {scroll_indicator}  Press [cyan]q[/cyan] to return.")
+            # console.print(f"\n[bold]Options:[/bold] {scroll_indicator}  Press [cyan]c[/cyan] to export, [cyan]q[/cyan] to return.")
+            # Temporarily removing CSV export from this view as export_pivot_data_to_csv is not defined here
+            console.print(f"\n[bold]Options:[/bold] {scroll_indicator}  Press [cyan]q[/cyan] to return.")
+
+            redraw = False
 
         key = readchar.readkey() # Read the key press here
         try:
-            # if key.lower() == 'c':
-            #     console.print("[yellow]CSV export for this view to be re-implemented.[/yellow]")
-            #     # export_pivot_data_to_csv(csv_export_rows, default_filename="historical_snapshot_view.csv")
-            if key.lower() == 'q':
+            # Keys that queued up while the page was drawing (e.g. a held arrow key) are
+            # all applied before the next redraw, so only the final page is drawn
+            quit_view = False
+            while True:
+                # if key.lower() == 'c':
+                #     console.print("[yellow]CSV export for this view to be re-implemented.[/yellow]")
+                #     # export_pivot_data_to_csv(csv_export_rows, default_filename="historical_snapshot_view.csv")
+                if key.lower() == 'q':
+                    quit_view = True
+                    break
+                elif key.lower() == 'r' or key == readchar.key.RIGHT:
+                    if current_page_start_idx < max_page_start_idx:
+                        current_page_start_idx = min(max_page_start_idx, current_page_start_idx + num_scrollable_cols_on_page)
+                        redraw = True
+                elif key.lower() == 'l' or key == readchar.key.LEFT:
+                    if current_page_start_idx > 0:
+                        current_page_start_idx = max(0, current_page_start_idx - num_scrollable_cols_on_page)
+                        redraw = True
+                if not _key_waiting():
+                    break
+                key = readchar.readkey()
+            if quit_view:
                 console.clear()
                 break
-            elif key.lower() == 'r' or key == readchar.key.RIGHT:
-                if page_end_idx < len(scrollable_column_names):
-                    current_page_start_idx = min(page_end_idx, len(scrollable_column_names) - num_scrollable_cols_on_page) if num_scrollable_cols_on_page > 0 else page_end_idx
-            elif key.lower() == 'l' or key == readchar.key.LEFT:
-                if current_page_start_idx > 0:
-                    current_page_start_idx = max(0, current_page_start_idx - num_scrollable_cols_on_page)
         except Exception as e:
             console.print(f"[red]An error occurred: {e}. Returning.[/red]")
             console.input("Press Enter to continue...") 
@@ -648,6 +853,34 @@ def view_historical_snapshots_table(console: Console, snapshots: list, financial
             break
     # End of while True for scrolling
 
+def _balance_totals(snapshot_balances: list, items_dict: dict) -> tuple[float, float, float]:
+    """Returns (total assets, total debts, positive liquid assets) for one date's balances.
+       Balances for unknown item IDs are ignored.
+    """
+    total_assets = total_debts = liquid_assets = 0.0
+    for balance_entry in snapshot_balances:
+        item_details = items_dict.get(balance_entry.get("item_id"))
+        if not item_details: continue
+        balance = balance_entry.get("balance", 0.0)
+        if balance > 0:
+            total_assets += balance
+            if item_details.get("liquid", False):
+                liquid_assets += balance
+        elif balance < 0:
+            total_debts += balance
+    return total_assets, total_debts, liquid_assets
+
+def _index_appended(index: dict, records: list):
+    """Adds records in `records` that `index` (id -> record) does not hold yet.
+       Edits to existing records need nothing, as the index holds the same dicts.
+    """
+    for record in records:
+        if record['id'] not in index:
+            index[record['id']] = record
+
+# Rows per page of the item management table
+ITEMS_PAGE_SIZE = 25
+
 def asset_management_screen(console: Console, categories: list, financial_items: list, snapshots: list, current_snapshot_balances: list, current_date: str):
     """
     Displays the asset management screen for viewing and editing financial items and their balances.
@@ -658,85 +891,93 @@ def asset_management_screen(console: Console, categories: list, financial_items:
     
     items_dict = {item['id']: item for item in financial_items}
     cats_dict = {cat['id']: cat for cat in categories}
+    # (assets, debts, liquid) for the date's balances; reset to None when an item or balance changes
+    balance_totals = None
+    redraw = True
+    items_page = 0 # Page of the items table on screen
 
     while True:
-        console.clear()
-        console.print("\n[bold blue]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold blue]")
-        console.print("[bold blue]FINANCIAL ITEM MANAGEMENT[/bold blue]")
-        console.print(f"[bold blue]For Date: [cyan]{current_date}[/cyan][/bold blue]")
-        console.print("[bold blue]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold blue]")
+        # An invalid key is answered below the current screen instead of redrawing it
+        if redraw:
+            console.clear()
+            console.print(
+                "\n[bold blue]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold blue]\n"
+                "[bold blue]FINANCIAL ITEM MANAGEMENT[/bold blue]\n"
+                f"[bold blue]For Date: [cyan]{current_date}[/cyan][/bold blue]\n"
+                "[bold blue]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold blue]"
+            )
         
-        current_total_assets_val = 0.0
-        current_total_debts_val = 0.0
-        current_liquid_assets_val = 0.0
-
-        for balance_entry in current_snapshot_balances:
-            item_id = balance_entry.get("item_id")
-            balance = balance_entry.get("balance", 0.0)
-            item_details = items_dict.get(item_id)
-            if not item_details: continue
-            if balance > 0:
-                current_total_assets_val += balance
-                if item_details.get("liquid", False):
-                    current_liquid_assets_val += balance
-            elif balance < 0:
-                current_total_debts_val += balance
+            if balance_totals is None:
+                balance_totals = _balance_totals(current_snapshot_balances, items_dict)
+            current_total_assets_val, current_total_debts_val, current_liquid_assets_val = balance_totals
         
-        current_net_worth_val = current_total_assets_val + current_total_debts_val
+            current_net_worth_val = current_total_assets_val + current_total_debts_val
         
-        console.print()
-        console.print(f"[bold]Net Worth ({current_date}):[/bold] [{'green' if current_net_worth_val >= 0 else 'red'}]£{current_net_worth_val:,.2f}[/{'green' if current_net_worth_val >= 0 else 'red'}]")
-        console.print(f"[bold]Total Assets:[/bold] [green]£{current_total_assets_val:,.2f}[/green]")
-        console.print(f"[bold]Total Debts:[/bold] [red]£{current_total_debts_val:,.2f}[/red]")
-        console.print(f"[bold]Sum of Positive Liquid Items:[/bold] [cyan]£{current_liquid_assets_val:,.2f}[/cyan]")
-        console.print()
+            console.print()
+            net_worth_style = "green" if current_net_worth_val >= 0 else "red"
+            console.print(f"[bold]Net Worth ({current_date}):[/bold] [{net_worth_style}]£{current_net_worth_val:,.2f}[/]")
+            console.print(f"[bold]Total Assets:[/bold] [green]£{current_total_assets_val:,.2f}[/green]")
+            console.print(f"[bold]Total Debts:[/bold] [red]£{current_total_debts_val:,.2f}[/red]")
+            console.print(f"[bold]Sum of Positive Liquid Items:[/bold] [cyan]£{current_liquid_assets_val:,.2f}[/cyan]")
+            console.print()
         
-        if current_snapshot_balances:
-            table = Table(
-                title=Text(f"Items and Balances for {current_date}", style="bold"),
-                show_header=True, header_style="bold", box=box.SIMPLE, padding=(0, 1)
-            )
-            table.add_column("#", style="dim", width=4, justify="right")
-            table.add_column("Item Name", min_width=20)
-            table.add_column("Balance", justify="right", min_width=15)
-            table.add_column("Category", min_width=15, style="dim")
-            table.add_column("Liquid", justify="center", min_width=8)
+            if current_snapshot_balances:
+                # Only the rows of the page on screen are built. Deleting items can leave
+                # the page past the end, so it is pulled back onto the last page.
+                num_items_pages = (len(current_snapshot_balances) + ITEMS_PAGE_SIZE - 1) // ITEMS_PAGE_SIZE
+                items_page = min(items_page, num_items_pages - 1)
+                page_start = items_page * ITEMS_PAGE_SIZE
+                table_title = f"Items and Balances for {current_date}"
+                if num_items_pages > 1:
+                    table_title += f" (page {items_page + 1} of {num_items_pages})"
+                table = Table(
+                    title=Text(table_title, style="bold"),
+                    show_header=True, header_style="bold", box=box.SIMPLE, padding=(0, 1)
+                )
+                table.add_column("#", style="dim", width=4, justify="right")
+                table.add_column("Item Name", min_width=20)
+                table.add_column("Balance", justify="right", min_width=15)
+                table.add_column("Category", min_width=15, style="dim")
+                table.add_column("Liquid", justify="center", min_width=8)
             
-            for idx, balance_entry in enumerate(current_snapshot_balances, 1):
-                item_id = balance_entry.get("item_id")
-                balance = balance_entry.get("balance", 0.0)
-                item_details = items_dict.get(item_id)
-                if not item_details:
-                    item_name_str = f"Unknown Item (ID: {item_id})"
-                    category_name_str = "Unknown"
-                    is_liquid_val = False
-                else:
-                    item_name_str = item_details.get("name", f"Unnamed Item (ID: {item_id})")
-                    category_id = item_details.get("category_id")
-                    cat_details = cats_dict.get(category_id)
-                    category_name_str = cat_details.get("name", "Uncategorized") if cat_details else "Invalid Category ID"
-                    is_liquid_val = item_details.get("liquid", False)
+                # Rows keep their overall numbers, which are what 'm' asks for
+                for idx, balance_entry in enumerate(current_snapshot_balances[page_start:page_start + ITEMS_PAGE_SIZE], page_start + 1):
+                    item_id = balance_entry.get("item_id")
+                    balance = balance_entry.get("balance", 0.0)
+                    item_details = items_dict.get(item_id)
+                    if not item_details:
+                        item_name_str = f"Unknown Item (ID: {item_id})"
+                        category_name_str = "Unknown"
+                        is_liquid_val = False
+                    else:
+                        item_name_str = item_details.get("name", f"Unnamed Item (ID: {item_id})")
+                        category_id = item_details.get("category_id")
+                        cat_details = cats_dict.get(category_id)
+                        category_name_str = cat_details.get("name", "Uncategorized") if cat_details else "Invalid Category ID"
+                        is_liquid_val = item_details.get("liquid", False)
                 
-                liquid_status_text = Text("Yes", style="green") if is_liquid_val else Text("No", style="red")
-                balance_color_style = "green" if balance >= 0 else "red"
-                balance_text_str = Text(f"£{balance:,.2f}", style=balance_color_style)
+                    liquid_status_text = _YES_TEXT if is_liquid_val else _NO_TEXT
                 
-                table.add_row(str(idx), item_name_str, balance_text_str, category_name_str, liquid_status_text)
-            console.print(table)
+                    table.add_row(str(idx), item_name_str, _balance_cell(balance), category_name_str, liquid_status_text)
+                console.print(table)
             
-            console.print("\n[bold]Options:[/bold]")
-            console.print(" • Press [cyan]m[/cyan] then item # to manage its balance/properties for this date")
-            console.print(" • Press [cyan]a[/cyan] to add a new financial item (globally) and set its balance for this date")
-            console.print(" • Press [cyan]c[/cyan] to manage categories (add, edit, delete)")
-            console.print(" • Press [cyan]h[/cyan] to view all snapshot history (table view)")
-            console.print(" • Press [cyan]q[/cyan] to return to dashboard")
-        else:
-            console.print(f"[yellow]No items with balances defined for {current_date}.[/yellow]")
-            console.print("\n[bold]Options:[/bold]")
-            console.print(" • Press [cyan]a[/cyan] to add a new financial item (globally) and set its balance for this date")
-            console.print(" • Press [cyan]c[/cyan] to manage categories (add, edit, delete)")
-            console.print(" • Press [cyan]h[/cyan] to view all snapshot history (table view)")
-            console.print(" • Press [cyan]q[/cyan] to return to dashboard")
+                console.print("\n[bold]Options:[/bold]")
+                console.print(" • Press [cyan]m[/cyan] then item # to manage its balance/properties for this date")
+                if num_items_pages > 1:
+                    console.print(" • Press [cyan]n[/cyan]/[cyan]p[/cyan] for the next/previous page of items")
+                console.print(" • Press [cyan]a[/cyan] to add a new financial item (globally) and set its balance for this date")
+                console.print(" • Press [cyan]c[/cyan] to manage categories (add, edit, delete)")
+                console.print(" • Press [cyan]h[/cyan] to view all snapshot history (table view)")
+                console.print(" • Press [cyan]q[/cyan] to return to dashboard")
+            else:
+                console.print(f"[yellow]No items with balances defined for {current_date}.[/yellow]")
+                console.print("\n[bold]Options:[/bold]")
+                console.print(" • Press [cyan]a[/cyan] to add a new financial item (globally) and set its balance for this date")
+                console.print(" • Press [cyan]c[/cyan] to manage categories (add, edit, delete)")
+                console.print(" • Press [cyan]h[/cyan] to view all snapshot history (table view)")
+                console.print(" • Press [cyan]q[/cyan] to return to dashboard")
+
+        redraw = True
 
         console.print("\nEnter action: ", end="")
         try:
@@ -745,9 +986,17 @@ def asset_management_screen(console: Console, categories: list, financial_items:
             console.print()
 
             if key.lower() == 'q':
-                console.print("[yellow]Returning to dashboard...[/yellow]")
                 return categories, financial_items, snapshots, current_snapshot_balances, changes_made_overall
             
+            elif key.lower() in ('n', 'p'):
+                # Paging past either end changes nothing, so the screen is left as it is
+                new_items_page = items_page + 1 if key.lower() == 'n' else items_page - 1
+                if 0 <= new_items_page * ITEMS_PAGE_SIZE < len(current_snapshot_balances):
+                    items_page = new_items_page
+                else:
+                    redraw = False
+                continue
+
             elif key.lower() == 'a':
                 item_added = add_new_financial_item_interactive(
                     console, # Passing console as console_instance
@@ -758,16 +1007,19 @@ def asset_management_screen(console: Console, categories: list, financial_items:
                 )
                 if item_added:
                     changes_made_overall = True
-                    items_dict = {item['id']: item for item in financial_items}
-                    cats_dict = {cat['id']: cat for cat in categories}
+                    balance_totals = None
+                    # The new item, and any category made for it, were appended in place
+                    _index_appended(items_dict, financial_items)
+                    _index_appended(cats_dict, categories)
                 continue
 
             elif key.lower() == 'c':
                 updated_categories_list = manage_categories_interactive(categories, financial_items, console)
                 if updated_categories_list is not categories:
                     categories = updated_categories_list
-                    cats_dict = {cat['id']: cat for cat in categories}
                     changes_made_overall = True
+                # Categories may have been added or removed in place, so always re-index
+                cats_dict = {cat['id']: cat for cat in categories}
                 continue
 
             elif key.lower() == 'h':
@@ -804,14 +1056,21 @@ def asset_management_screen(console: Console, categories: list, financial_items:
                         )
                         
                         if item_management_changes:
+                            # The lists come back edited in place; only a replaced list needs a full rebuild
+                            if updated_financial_items is not financial_items:
+                                items_dict = {item['id']: item for item in updated_financial_items}
+                            elif len(financial_items) < len(items_dict): # The item was deleted
+                                items_dict.pop(item_id_to_manage_local, None)
+                            if updated_categories is not categories:
+                                cats_dict = {cat['id']: cat for cat in updated_categories}
+                            else: # A category may have been created for the item
+                                _index_appended(cats_dict, categories)
                             financial_items = updated_financial_items
                             categories = updated_categories
                             snapshots = updated_snapshots
                             current_snapshot_balances = updated_current_snapshot_balances
                             changes_made_overall = True
-                            # Rebuild dicts if they are used before next loop iteration for display
-                            items_dict = {item['id']: item for item in financial_items}
-                            cats_dict = {cat['id']: cat for cat in categories}
+                            balance_totals = None
                         
                     else:
                         console.print(f"[red]Invalid item number. Please enter a number between 1 and {len(current_snapshot_balances)}.[/red]")
@@ -826,7 +1085,7 @@ def asset_management_screen(console: Console, categories: list, financial_items:
                 continue # Go back to asset_management_screen menu
             else:
                 console.print(f"[red]Invalid option: '{key}'.[/red]")
-                console.input("Press Enter to continue...")
+                redraw = False
                 continue
         
         except Exception as e:
@@ -911,7 +1170,7 @@ def file_options_screen(console: Console, categories: list, financial_items: lis
                         console.print(f"[red]Failed to load data from '{new_file_path}'. Check messages above. No changes made.[/red]")
                 else:
                     console.print("[yellow]Load operation cancelled.[/yellow]")
-            Prompt.ask("\nPress Enter to continue...", console=console, show_default=False)
+            console.input("\nPress Enter to continue...")
 
         elif choice == "Set As Current Data File Path (for next save/load)":
             new_save_path = Prompt.ask("Enter the new file path to use for saving/loading (e.g., my_net_worth.json)", default=current_data_file, console=console).strip()
@@ -925,7 +1184,7 @@ def file_options_screen(console: Console, categories: list, financial_items: lis
                 console.print("[dim]Data will be saved to/loaded from this path next time.[/dim]")
             else:
                 console.print("[yellow]File path is the same as the current one. No change made.[/yellow]")
-            Prompt.ask("\nPress Enter to continue...", console=console, show_default=False)
+            console.input("\nPress Enter to continue...")
 
         elif choice == "Back to Main Menu" or choice is None:
             # Return original or updated file path, but other data is unchanged unless loaded.
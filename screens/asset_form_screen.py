@@ -1,13 +1,15 @@
 from textual.app import ComposeResult, App
 from textual.screen import ModalScreen
-from textual.widgets import Header, Footer, Button, Input, Label, Select, RadioSet, Checkbox, Static
+from textual.widgets import Header, Footer, Button, Input, Label, Select, RadioSet, RadioButton, Checkbox, Static
 from textual.containers import VerticalScroll, Horizontal, Vertical
 from datetime import datetime # For generating unique IDs
-import uuid # For more robust unique IDs
+import os # os.urandom for unique IDs
 
 class AssetFormScreen(ModalScreen):
     """A modal screen to add or edit a financial item."""
 
+    AUTO_FOCUS = "#item_name_input"
+
     DEFAULT_CSS = """
     AssetFormScreen {
         align: center middle;
@@ -56,50 +58,48 @@ class AssetFormScreen(ModalScreen):
         self.screen_title = "Edit Financial Item" if self.is_edit_mode else "Add New Financial Item"
 
     def compose(self) -> ComposeResult:
+        # Fields are created already holding their values (the item's, or the add-mode
+        # defaults of Asset and Liquid), so nothing has to be filled in and redrawn after mount
+        # The app's cached options are reused as long as the categories haven't changed
+        category_map, category_options = self.app_instance.get_category_lookups(self.categories)
+        item = self.item_to_edit if self.is_edit_mode and self.item_to_edit else {}
+        category_id = item.get('category_id')
+        is_asset = item.get('type', 'asset') == 'asset'
+        is_liquid = item.get('liquid', False) if item else True
+
         with Vertical(id="dialog"):
             yield Static(self.screen_title, classes="dialog_title") # Using Static for title styling flexibility
             with VerticalScroll():
                 yield Label("Item Name:", classes="field_label")
-                yield Input(placeholder="e.g., 'Main Savings Account'", id="item_name_input")
+                # Fields are kept as attributes for reading back on save
+                self.name_input = Input(value=item.get('name', ''), placeholder="e.g., 'Main Savings Account'", id="item_name_input")
+                yield self.name_input
                 
                 yield Label("Category:", classes="field_label")
-                yield Select([], id="item_category_select", prompt="Select a category")
+                self.category_select = Select(
+                    category_options, id="item_category_select", prompt="Select a category",
+                    value=category_id if category_id in category_map else Select.BLANK # Select matches by value (ID)
+                )
+                yield self.category_select
 
                 yield Label("Item Type:", classes="field_label")
-                yield RadioSet("Asset", "Liability", id="item_type_radioset")
+                self.type_radioset = RadioSet(RadioButton("Asset", value=is_asset), RadioButton("Liability", value=not is_asset), id="item_type_radioset")
+                yield self.type_radioset
 
                 yield Label("Liquidity Status:", classes="field_label")
-                yield RadioSet("Liquid", "Not Liquid", id="item_liquid_radioset")
+                self.liquid_radioset = RadioSet(RadioButton("Liquid", value=is_liquid), RadioButton("Not Liquid", value=not is_liquid), id="item_liquid_radioset")
+                yield self.liquid_radioset
             
             with Horizontal(id="button_bar"):
                 yield Button("Cancel", id="cancel_button", variant="default")
                 yield Button("Save Changes" if self.is_edit_mode else "Add Item", id="save_button", variant="primary")
 
-    def on_mount(self) -> None:
-        self.query_one("#item_name_input", Input).focus()
-
-        # Populate category select
-        category_options = [(cat.get('name', 'Unnamed Category'), cat.get('id')) for cat in self.categories if cat.get('id')]
-        category_select = self.query_one("#item_category_select", Select)
-        category_select.set_options(category_options)
-
-        if self.is_edit_mode and self.item_to_edit:
-            self.query_one("#item_name_input", Input).value = self.item_to_edit.get('name', '')
-            category_select.value = self.item_to_edit.get('category_id') # Select will find by value (ID)
-            item_type = self.item_to_edit.get('type', 'asset')
-            self.query_one("#item_type_radioset", RadioSet).pressed_button_label = item_type.capitalize()
-            self.query_one("#item_liquid_radioset", RadioSet).pressed_button_label = "Liquid" if self.item_to_edit.get('liquid', False) else "Not Liquid"
-        else:
-            # Default for add mode
-            self.query_one("#item_type_radioset", RadioSet).pressed_button_label = "Asset"
-            self.query_one("#item_liquid_radioset", RadioSet).pressed_button_label = "Liquid"
-
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "save_button":
-            name_input = self.query_one("#item_name_input", Input)
-            category_select = self.query_one("#item_category_select", Select)
-            type_radioset = self.query_one("#item_type_radioset", RadioSet)
-            liquid_radioset = self.query_one("#item_liquid_radioset", RadioSet)
+            name_input = self.name_input
+            category_select = self.category_select
+            type_radioset = self.type_radioset
+            liquid_radioset = self.liquid_radioset
 
             item_name = name_input.value.strip()
             if not item_name:
@@ -113,11 +113,11 @@ class AssetFormScreen(ModalScreen):
                 return
 
             item_data = {
-                "id": self.item_to_edit.get('id') if self.is_edit_mode else f"item_{uuid.uuid4().hex[:8]}",
+                "id": self.item_to_edit.get('id') if self.is_edit_mode else f"item_{os.urandom(4).hex()}",
                 "name": item_name,
                 "category_id": category_select.value,
-                "type": type_radioset.pressed_button_label.lower() if type_radioset.pressed_button else 'asset',
-                "liquid": liquid_radioset.pressed_button_label == "Liquid" if liquid_radioset.pressed_button else False
+                "type": str(type_radioset.pressed_button.label).lower() if type_radioset.pressed_button else 'asset',
+                "liquid": str(liquid_radioset.pressed_button.label) == "Liquid" if liquid_radioset.pressed_button else False
             }
             self.dismiss(item_data)
 
@@ -3,11 +3,40 @@ from textual.screen import Screen
 from textual.widgets import Header, Footer, Button, DataTable # Removed Placeholder, added DataTable
 from textual.containers import VerticalScroll, Container, Horizontal # Added Container, Horizontal
 from textual.coordinate import Coordinate # Added for DataTable.update_cell_at
+from rich.style import Style
 from rich.text import Text # Import Rich Text
+from functools import lru_cache
 
 from .asset_form_screen import AssetFormScreen # Import the new form screen
 from .confirm_delete_screen import ConfirmDeleteScreen # Import ConfirmDeleteScreen
 
+# Row key of the "no items" message row shown while the table is empty
+NO_ITEMS_ROW_KEY = "__no_items__"
+
+# Cell styles, parsed once rather than from a style string per cell
+POSITIVE_STYLE = Style(color="green")
+NEGATIVE_STYLE = Style(color="red")
+ZERO_STYLE = Style(color="grey50", dim=True)
+
+# Type and Liquid cells, shared by every row as ready-styled Text so no markup is parsed
+# per cell. Other item types are built when a row is.
+TYPE_CELLS = {'asset': Text("Asset", style=POSITIVE_STYLE), 'liability': Text("Liability", style=NEGATIVE_STYLE)}
+LIQUID_YES_CELL = Text("Yes", style=Style(color="cyan", bold=True))
+LIQUID_NO_CELL = Text("No", style=Style(color="dark_orange", dim=True))
+
+@lru_cache(maxsize=512)
+def balance_cell(balance: float) -> Text:
+    """Right-aligned balance cell: green above zero, red below, dim grey at zero.
+       Memoised, as many items share balances (zero especially); the Text is shared.
+    """
+    if balance > 0:
+        balance_style = POSITIVE_STYLE
+    elif balance < 0:
+        balance_style = NEGATIVE_STYLE
+    else:
+        balance_style = ZERO_STYLE
+    return Text(f"£{balance:,.2f}", style=balance_style, justify="right")
+
 class AssetManagementScreen(Screen):
     """A screen for managing financial assets and liabilities."""
 
@@ -18,13 +47,22 @@ class AssetManagementScreen(Screen):
         self.app_instance = app_instance
         # self.financial_items = financial_items # Original list, if needed for comparison
         self.categories = categories
-        self.category_map = {cat['id']: cat['name'] for cat in self.categories} # For easy name lookup
-        # We'll store a working copy of items for editing/adding/deleting
-        self.working_financial_items = [item.copy() for item in financial_items]
+        self.category_map = app_instance.get_category_lookups(self.categories)[0] # For easy name lookup, shared with the app
+        # We'll store a working copy of the list for editing/adding/deleting. The item dicts
+        # themselves are shared, not copied: this screen never changes an item in place, an
+        # edit swaps in the new dict returned by AssetFormScreen.
+        self.working_financial_items = list(financial_items)
+        # Item ID -> working item, kept in step with working_financial_items on add/edit/delete
+        self.items_by_id = {item['id']: item for item in self.working_financial_items}
         # Create a map for quick balance lookup
         self.balance_map = {balance_entry['item_id']: balance_entry['balance'] for balance_entry in current_snapshot_balances}
+        # Every item gets an entry (0.0 if it has no balance yet), so rows can index it directly
+        for item in self.working_financial_items:
+            self.balance_map.setdefault(item['id'], 0.0)
         self.is_dirty = False # Track if changes have been made
         self.selected_row_item_id: str | None = None # To store the ID of the selected row
+        self.row_cells_by_id: dict[str, tuple] = {} # Cells currently shown in each item's row
+        self.showing_no_items_row = False # Whether the "no items" row is in the table
 
     def compose(self) -> ComposeResult:
         yield Header(name="View & Manage Financial Items")
@@ -38,10 +76,14 @@ class AssetManagementScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        table = self.query_one(DataTable)
+        # Widgets used on every selection and table change, looked up once
+        table = self.table = self.query_one(DataTable)
+        self.edit_button = self.query_one("#edit_item_button", Button)
+        self.delete_button = self.query_one("#delete_item_button", Button)
         table.cursor_type = "row"
-        table.add_columns("Name", "Category", "Type", "Liquid", "Current Balance") # Added Current Balance column
-        self._refresh_table_data() # Use helper to populate initially
+        # Column keys, in cell order, for updating a single row in place
+        self.column_keys = table.add_columns("Name", "Category", "Type", "Liquid", "Current Balance") # Added Current Balance column
+        self._refresh_table_data() # Full build on mount; add/edit/delete then only touch their own row
 
     async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in the DataTable."""
@@ -49,16 +91,14 @@ class AssetManagementScreen(Screen):
             self.selected_row_item_id = str(event.row_key.value)
             # Enable edit/delete buttons now that a row is selected and we have its ID
             # (assuming they might have been disabled if no rows or no selection initially)
-            edit_button = self.query_one("#edit_item_button", Button)
-            delete_button = self.query_one("#delete_item_button", Button)
             if self.working_financial_items: # Only enable if there are items to act upon
-                edit_button.disabled = False
-                delete_button.disabled = False
+                self.edit_button.disabled = False
+                self.delete_button.disabled = False
         else:
             self.selected_row_item_id = None
             # Optionally disable edit/delete if no valid row is selected
-            # self.query_one("#edit_item_button", Button).disabled = True
-            # self.query_one("#delete_item_button", Button).disabled = True
+            # self.edit_button.disabled = True
+            # self.delete_button.disabled = True
 
     def action_request_close(self) -> None:
         """Called when escape is pressed."""
@@ -84,7 +124,7 @@ class AssetManagementScreen(Screen):
                 self.app_instance.notify("No item selected to edit. Please click on a row in the table first.", severity="error", title="Selection Error")
                 return
 
-            item_to_edit = next((item for item in self.working_financial_items if item['id'] == self.selected_row_item_id), None)
+            item_to_edit = self.items_by_id.get(self.selected_row_item_id)
 
             if item_to_edit:
                 self.app_instance.push_screen(
@@ -101,7 +141,7 @@ class AssetManagementScreen(Screen):
                 return
             
             selected_item_name = "Unknown Item"
-            item_to_delete = next((item for item in self.working_financial_items if item['id'] == self.selected_row_item_id), None)
+            item_to_delete = self.items_by_id.get(self.selected_row_item_id)
             if item_to_delete:
                 selected_item_name = item_to_delete.get('name', selected_item_name)
             
@@ -114,11 +154,12 @@ class AssetManagementScreen(Screen):
         """Callback for when the AssetFormScreen returns a new item."""
         if new_item:
             # Check for ID collision before adding (though UUIDs make this very unlikely)
-            if any(item['id'] == new_item['id'] for item in self.working_financial_items):
+            if new_item['id'] in self.items_by_id:
                 self.app_instance.notify(f"Error: Item with ID '{new_item['id']}' already exists.", title="Add Error", severity="error")
                 return
 
             self.working_financial_items.append(new_item)
+            self.items_by_id[new_item['id']] = new_item
             # New items won't have a balance in the existing self.balance_map from __init__
             # We should add a default balance (0.0) for them in the map for immediate display
             # Or, ideally, the main app would update its current_snapshot_balances and pass the refreshed one.
@@ -126,7 +167,7 @@ class AssetManagementScreen(Screen):
             if new_item['id'] not in self.balance_map:
                  self.balance_map[new_item['id']] = 0.0
             self.is_dirty = True
-            self._refresh_table_data()
+            self._add_row(new_item)
             self.app_instance.notify(f"Item '{new_item.get('name')}' added.", title="Item Added")
         else:
             self.app_instance.notify("Add item cancelled.", title="Cancelled")
@@ -135,17 +176,15 @@ class AssetManagementScreen(Screen):
         """Callback for when the AssetFormScreen returns an edited item."""
         if edited_item:
             item_id_to_update = edited_item.get('id')
-            found_item_index = -1
-            for i, item in enumerate(self.working_financial_items):
-                if item.get('id') == item_id_to_update:
-                    found_item_index = i
-                    break
+            item_being_replaced = self.items_by_id.get(item_id_to_update)
             
-            if found_item_index != -1:
-                self.working_financial_items[found_item_index] = edited_item
+            if item_being_replaced is not None:
+                # Replace it in the same list position so the table order is unchanged
+                self.working_financial_items[self.working_financial_items.index(item_being_replaced)] = edited_item
+                self.items_by_id[item_id_to_update] = edited_item
                 # Balances are not edited on this screen, so self.balance_map remains valid
                 self.is_dirty = True
-                self._refresh_table_data() # Refresh the entire table
+                self._update_row(edited_item)
                 self.app_instance.notify(f"Item '{edited_item.get('name')}' updated.", title="Item Updated")
             else:
                 # This case should ideally not be reached if editing an existing item whose ID hasn't changed.
@@ -160,7 +199,7 @@ class AssetManagementScreen(Screen):
                 self.app_instance.notify("Error: No item ID was selected for deletion.", title="Delete Error", severity="error")
                 return
 
-            item_to_remove = next((item for item in self.working_financial_items if item['id'] == self.selected_row_item_id), None)
+            item_to_remove = self.items_by_id.pop(self.selected_row_item_id, None)
             if item_to_remove:
                 item_name = item_to_remove.get('name', self.selected_row_item_id) # Get name for notification
                 self.working_financial_items.remove(item_to_remove)
@@ -170,78 +209,98 @@ class AssetManagementScreen(Screen):
                     del self.balance_map[self.selected_row_item_id]
                 
                 self.is_dirty = True
-                self._refresh_table_data() # Refresh table to remove the row
+                self._remove_row(self.selected_row_item_id)
                 self.app_instance.notify(f"Item '{item_name}' and its historical data permanently deleted.", title="Item Deleted")
                 self.selected_row_item_id = None # Clear selection as item is gone
+                # Nothing is selected until another row is clicked
+                self.edit_button.disabled = True
+                self.delete_button.disabled = True
             else:
                 self.app_instance.notify(f"Error: Item with ID '{self.selected_row_item_id}' not found for deletion.", title="Delete Error", severity="error")
         else:
             self.app_instance.notify("Deletion cancelled.", title="Cancelled")
 
     def _refresh_table_data(self) -> None:
-        """Helper to clear and reload all data into the DataTable."""
-        table = self.query_one(DataTable)
-        # Storing current cursor and scroll position to try and restore it
-        # current_cursor_row = table.cursor_row # We can read it, but not set it directly
-        current_scroll_y = self.query_one(VerticalScroll).scroll_y
+        """Helper to clear and reload all data into the DataTable.
+           Only used on mount, before anything has scrolled; later changes go through
+           _add_row/_update_row/_remove_row, which leave the cursor and scroll position alone.
+        """
+        table = self.table
 
         table.clear(columns=False) # Keep columns, just clear rows
+        self.showing_no_items_row = False
         
-        for item in self.working_financial_items:
-            item_id = item.get('id')
-            category_name = self.category_map.get(item.get('category_id', ''), 'N/A')
-            
-            item_type_raw = item.get('type', 'asset')
-            item_type_display = f"[green]{item_type_raw.capitalize()}[/green]" if item_type_raw == 'asset' else f"[red]{item_type_raw.capitalize()}[/red]"
-            
-            is_liquid_raw = item.get('liquid', False)
-            is_liquid_display = f"[b cyan]Yes[/b cyan]" if is_liquid_raw else f"[dim orange]No[/dim orange]"
-            
-            current_balance = self.balance_map.get(item_id, 0.0) 
-            balance_text_str = f"£{current_balance:,.2f}"
-            
-            balance_style = ""
-            if current_balance > 0:
-                balance_style = "green"
-            elif current_balance < 0:
-                balance_style = "red"
-            else:
-                balance_style = "dim grey" # Or just "" for default terminal color
+        self.row_cells_by_id.clear()
+        # add_rows can't take row keys, which selection relies on, so rows are added one
+        # at a time inside a batch update to lay out and repaint the table once at the end
+        with self.app.batch_update():
+            for item in self.working_financial_items:
+                row_cells = self.row_cells_by_id[item.get('id')] = self._row_cells(item)
+                # ID is not added as a visible cell, only as key
+                table.add_row(*row_cells, key=item.get('id'))
+            if not self.working_financial_items:
+                self._add_no_items_row(table)
+        # Disabled until a row is selected
+        self.edit_button.disabled = True
+        self.delete_button.disabled = True
 
-            balance_display = Text(balance_text_str, style=balance_style, justify="right")
-            
-            # ID is not added as a visible cell, only as key
-            table.add_row(
-                item.get('name', 'N/A'), 
-                category_name, 
-                item_type_display, 
-                is_liquid_display,
-                balance_display, # Added balance display
-                key=item_id
-            )
+    def _add_row(self, item: dict) -> None:
+        """Appends the row for a newly added item, replacing the "no items" row if shown."""
+        table = self.table
+        if self.showing_no_items_row: # The first item replaces the "no items" row
+            table.remove_row(NO_ITEMS_ROW_KEY)
+            self.showing_no_items_row = False
+        row_cells = self.row_cells_by_id[item.get('id')] = self._row_cells(item)
+        table.add_row(*row_cells, key=item.get('id'))
+
+    def _update_row(self, item: dict) -> None:
+        """Rewrites the changed cells of an edited item's row in place, keeping the cursor and scroll position."""
+        table = self.table
+        item_id = item.get('id')
+        row_cells = self._row_cells(item)
+        shown_cells = self.row_cells_by_id.get(item_id) or (None,) * len(row_cells)
+        for column_key, cell, shown_cell in zip(self.column_keys, row_cells, shown_cells):
+            if cell != shown_cell: # An edit usually changes one or two fields
+                table.update_cell(item_id, column_key, cell, update_width=True)
+        self.row_cells_by_id[item_id] = row_cells
+
+    def _remove_row(self, item_id: str) -> None:
+        """Removes a deleted item's row, showing the "no items" row if none are left."""
+        table = self.table
+        table.remove_row(item_id)
+        self.row_cells_by_id.pop(item_id, None)
         if not self.working_financial_items:
-            # Spanning the message across available columns for better appearance if table is empty
-            col_count = len(table.columns)
-            placeholder_row = ["[b]No financial items found. Click 'Add New Item' to start.[/b]"] + [""] * (col_count - 1)
-            if col_count > 0: table.add_row(*placeholder_row) # Pass as multiple arguments
-            else: table.add_row(placeholder_row[0]) # Failsafe if no columns somehow
-            
-            self.query_one("#edit_item_button", Button).disabled = True
-            self.query_one("#delete_item_button", Button).disabled = True
-        else:
-            self.query_one("#edit_item_button", Button).disabled = True # Disable until a row is selected
-            self.query_one("#delete_item_button", Button).disabled = True # Disable until a row is selected
+            self._add_no_items_row(table)
+
+    def _add_no_items_row(self, table: DataTable) -> None:
+        """Adds the placeholder row shown while there are no items."""
+        # Spanning the message across available columns for better appearance if table is empty
+        col_count = len(table.columns)
+        placeholder_row = ["[b]No financial items found. Click 'Add New Item' to start.[/b]"] + [""] * (col_count - 1)
+        if col_count > 0: table.add_row(*placeholder_row, key=NO_ITEMS_ROW_KEY) # Pass as multiple arguments
+        else: table.add_row(placeholder_row[0], key=NO_ITEMS_ROW_KEY) # Failsafe if no columns somehow
+        self.showing_no_items_row = True
+
+    def _row_cells(self, item: dict) -> tuple:
+        """Builds the (name, category, type, liquid, balance) cells for an item's row."""
+        item_id = item.get('id')
+        category_name = self.category_map.get(item.get('category_id', ''), 'N/A')
+        
+        item_type_raw = item.get('type', 'asset')
+        item_type_display = TYPE_CELLS.get(item_type_raw) or Text(item_type_raw.capitalize(), style=NEGATIVE_STYLE)
+        
+        is_liquid_raw = item.get('liquid', False)
+        is_liquid_display = LIQUID_YES_CELL if is_liquid_raw else LIQUID_NO_CELL
+        
+        balance_display = balance_cell(self.balance_map[item_id])
         
-        # Try to restore scroll position
-        # if table.row_count > 0:
-        #     if 0 <= current_cursor_row < table.row_count:
-        #         # table.cursor_row = current_cursor_row # Cannot set cursor_row directly
-        #         pass # Cursor will reset
-        #     else:
-        #         # table.cursor_row = 0 # Default to first row if old cursor is out of bounds
-        #         pass # Cursor will reset
-        self.query_one(VerticalScroll).scroll_y = current_scroll_y
-        # table.refresh_rows() # Not strictly necessary after clear() and add_row() in a batch like this, but doesn't hurt.
+        return (
+            item.get('name', 'N/A'), 
+            category_name, 
+            item_type_display, 
+            is_liquid_display,
+            balance_display, # Added balance display
+        )
 
     # We will need methods to handle:
     # - Showing a form to add/edit an item (perhaps a new ModalScreen)
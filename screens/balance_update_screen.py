@@ -63,11 +63,15 @@ class QuickBalanceUpdateScreen(Screen):
                 "item_id": item['id'],
                 "name": item['name'],
                 "current_balance": current_val,
+                # Fixed for the screen's lifetime, so formatted once here rather than per move
+                "current_balance_text": f"Current Balance: £{current_val:,.2f}",
                 "new_balance": current_val 
             })
         
         self.current_item_idx = 0
         self.is_dirty = False 
+        self.loaded_input_value: str | None = None # Input text as set by _load_item_ui for the shown item
+        self.shown_label_texts: dict[Static, str] = {} # Text last put in each label by _load_item_ui
 
     def compose(self) -> ComposeResult:
         yield Header(name="Quick Balance Update")
@@ -95,8 +99,15 @@ class QuickBalanceUpdateScreen(Screen):
 
     def on_mount(self) -> None:
         if self.items_to_update:
+            # Widgets updated on every move between items, looked up once
+            self.item_name_label = self.query_one("#item_name_label", Static)
+            self.current_balance_label = self.query_one("#current_balance_label", Static)
+            self.new_balance_input = self.query_one("#new_balance_input", Input)
+            self.item_counter_label = self.query_one("#item_counter_label", Static)
+            self.prev_item_button = self.query_one("#prev_item_button", Button)
+            self.next_item_button = self.query_one("#next_item_button", Button)
             self._load_item_ui(self.current_item_idx)
-            self.query_one("#new_balance_input", Input).focus()
+            self.new_balance_input.focus()
         else:
             try:
                 close_button = self.query_one("#close_no_items_button", Button)
@@ -109,22 +120,32 @@ class QuickBalanceUpdateScreen(Screen):
             return
 
         item_data = self.items_to_update[idx]
-        self.query_one("#item_name_label", Static).update(f"Item: {item_data['name']}")
-        self.query_one("#current_balance_label", Static).update(f"Current Balance: £{item_data['current_balance']:,.2f}")
-        new_balance_input = self.query_one("#new_balance_input", Input)
-        new_balance_input.value = str(item_data['new_balance'])
-        new_balance_input.focus()
+        # Labels, input and buttons all change together; batch them into a single repaint
+        # (Enter to advance through items is the hot path)
+        with self.app.batch_update():
+            self._update_label(self.item_name_label, f"Item: {item_data['name']}")
+            self._update_label(self.current_balance_label, item_data['current_balance_text'])
+            self.new_balance_input.value = self.loaded_input_value = str(item_data['new_balance'])
+            self.new_balance_input.focus()
 
-        self.query_one("#item_counter_label", Static).update(f"{idx + 1} / {len(self.items_to_update)}")
+            self._update_label(self.item_counter_label, f"{idx + 1} / {len(self.items_to_update)}")
 
-        self.query_one("#prev_item_button", Button).disabled = (idx == 0)
-        self.query_one("#next_item_button", Button).disabled = (idx == len(self.items_to_update) - 1)
+            self.prev_item_button.disabled = (idx == 0)
+            self.next_item_button.disabled = (idx == len(self.items_to_update) - 1)
+
+    def _update_label(self, label: Static, text: str) -> None:
+        """Updates a label only if its text changes, sparing an unneeded refresh."""
+        if self.shown_label_texts.get(label) != text:
+            label.update(text)
+            self.shown_label_texts[label] = text
 
     def _save_current_input(self) -> bool:
         if not self.items_to_update:
             return False
         try:
-            new_balance_str = self.query_one("#new_balance_input", Input).value
+            new_balance_str = self.new_balance_input.value
+            if new_balance_str == self.loaded_input_value:
+                return True # Untouched since the item was shown (e.g. Enter to skip it), nothing to parse
             new_balance = float(new_balance_str)
             if self.items_to_update[self.current_item_idx]['new_balance'] != new_balance:
                 self.items_to_update[self.current_item_idx]['new_balance'] = new_balance
@@ -132,7 +153,7 @@ class QuickBalanceUpdateScreen(Screen):
             return True
         except ValueError:
             self.app_instance.notify("Invalid balance amount. Please enter a number.", severity="error", title="Input Error")
-            self.query_one("#new_balance_input", Input).focus()
+            self.new_balance_input.focus()
             return False
         except Exception as e:
             self.app_instance.notify(f"Error saving input: {e}", severity="error", title="Error")
@@ -140,11 +161,16 @@ class QuickBalanceUpdateScreen(Screen):
 
     def action_apply_changes(self):
         if self._save_current_input(): 
+            if not self.is_dirty:
+                self.dismiss([]) # Nothing changed, so no balance list is built
+                return
+            # Every item is included, changed or not: the app stores this list as the
+            # date's whole snapshot
             result_balances = [
                 {"item_id": item_d["item_id"], "balance": item_d["new_balance"]}
                 for item_d in self.items_to_update
             ]
-            self.dismiss(result_balances if self.is_dirty else []) 
+            self.dismiss(result_balances) 
 
     def action_request_close(self):
         if self.is_dirty:
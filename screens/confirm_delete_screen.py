@@ -6,6 +6,8 @@ from textual.containers import Vertical, Horizontal
 class ConfirmDeleteScreen(ModalScreen[bool]): # Specify bool as return type for dismiss
     """A modal screen to confirm irreversible deletion."""
 
+    AUTO_FOCUS = "#cancel_delete" # Default focus to cancel
+
     DEFAULT_CSS = """
     ConfirmDeleteScreen {
         align: center middle;
@@ -41,15 +43,16 @@ class ConfirmDeleteScreen(ModalScreen[bool]): # Specify bool as return type for
         with Vertical(id="confirm_delete_dialog"):
             yield Static("[b]Confirm Permanent Deletion[/b]", classes="dialog_title")
             yield Label(f"Are you sure you want to permanently delete '{self.item_name_to_delete}'?")
-            yield Label("This action is IRREVERSIBLE.", classes="warning_text")
-            yield Label("All historical balance entries for this item will also be permanently removed.", classes="warning_text")
+            # Both warning lines in one Label; the blank line stands in for the Label margin between them
+            yield Label(
+                "This action is IRREVERSIBLE.\n\n"
+                "All historical balance entries for this item will also be permanently removed.",
+                classes="warning_text"
+            )
             with Horizontal(id="button_bar"):
                 yield Button("Cancel", id="cancel_delete", variant="default")
                 yield Button("DELETE PERMANENTLY", id="confirm_delete_button", variant="error")
 
-    def on_mount(self) -> None:
-        self.query_one("#cancel_delete", Button).focus() # Default focus to cancel
-
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "confirm_delete_button":
             self.dismiss(True)
@@ -1,8 +1,15 @@
 import os
+from typing import Optional, Set
+from textual import work
+from textual.worker import get_current_worker
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Checkbox
 from textual.containers import VerticalScroll, Horizontal, Vertical
 from textual.app import ComposeResult
+from textual.timer import Timer
+
+# Seconds of typing pause before the path is checked on disk.
+EXISTS_CHECK_DELAY = 0.25
 
 class FileNewScreen(ModalScreen):
     """A modal screen to prompt for a new file path and confirm overwrite."""
@@ -42,6 +49,8 @@ class FileNewScreen(ModalScreen):
     def __init__(self, default_filename: str = "new_net_worth.json"):
         super().__init__()
         self.default_filename = default_filename
+        self._exists_timer: Optional[Timer] = None
+        self._existing_paths: Set[str] = set() # Paths seen to exist; "missing" isn't cached, as the file may be created meanwhile
 
     def compose(self) -> ComposeResult:
         with VerticalScroll():
@@ -60,10 +69,29 @@ class FileNewScreen(ModalScreen):
         self.query_one("#confirm_overwrite_checkbox", Checkbox).display = False 
 
     async def on_input_changed(self, event: Input.Changed) -> None:
-        file_path = event.value.strip()
+        if self._exists_timer is not None:
+            self._exists_timer.stop()
+        if event.value.strip() in self._existing_paths: # Already seen to exist (e.g. backspaced and retyped)
+            self._show_exists(event.value, True)
+            return
+        # Wait for a pause in typing rather than stat-ing the path on every keystroke
+        self._exists_timer = self.set_timer(EXISTS_CHECK_DELAY, lambda value=event.value: self._check_exists(value))
+
+    @work(thread=True, exclusive=True, group="path_exists")
+    def _check_exists(self, value: str) -> None:
+        # Runs in a thread so a slow filesystem can't stall the UI; a newer check cancels this one
+        file_path = value.strip()
+        exists = bool(file_path and os.path.exists(file_path))
+        if exists:
+            self._existing_paths.add(file_path)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_exists, value, exists)
+
+    def _show_exists(self, value: str, exists: bool) -> None:
+        if value != self.query_one("#file_path_input", Input).value:
+            return # Stale check; a newer one is already scheduled
         warning_label = self.query_one("#overwrite_warning_new_file", Label)
         overwrite_checkbox = self.query_one("#confirm_overwrite_checkbox", Checkbox)
-        exists = bool(file_path and os.path.exists(file_path))
         warning_label.display = exists
         overwrite_checkbox.display = exists 
         if not exists:
@@ -85,6 +113,7 @@ class FileNewScreen(ModalScreen):
                 return
             
             if os.path.exists(file_path) and not overwrite_checkbox.value:
+                self._show_exists(file_path_input.value, True) # The debounced check may not have shown the checkbox yet
                 self.notify("File exists. Please confirm overwrite or choose a different name.", severity="warning", title="Confirmation Needed")
                 overwrite_checkbox.focus()
                 return
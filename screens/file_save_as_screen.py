@@ -1,8 +1,15 @@
 import os
+from typing import Optional, Set
+from textual import work
+from textual.worker import get_current_worker
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label
 from textual.containers import VerticalScroll, Horizontal, Vertical
 from textual.app import ComposeResult
+from textual.timer import Timer
+
+# Seconds of typing pause before the path is checked on disk.
+EXISTS_CHECK_DELAY = 0.25
 
 class FileSaveAsScreen(ModalScreen):
     """A modal screen to prompt for a file path to save data as."""
@@ -37,6 +44,9 @@ class FileSaveAsScreen(ModalScreen):
     def __init__(self, current_filename: str):
         super().__init__()
         self.current_filename_for_placeholder = current_filename
+        self._exists_timer: Optional[Timer] = None
+        self._existing_paths: Set[str] = set() # Paths seen to exist; "missing" isn't cached, as the file may be created meanwhile
+        self._warned_path: Optional[str] = None # Path the overwrite warning is showing for
 
     def compose(self) -> ComposeResult:
         with VerticalScroll(): 
@@ -53,9 +63,30 @@ class FileSaveAsScreen(ModalScreen):
         self.query_one("#overwrite_warning", Label).display = False 
 
     async def on_input_changed(self, event: Input.Changed) -> None:
-        file_path = event.value.strip()
+        if self._exists_timer is not None:
+            self._exists_timer.stop()
+        if event.value.strip() in self._existing_paths: # Already seen to exist (e.g. backspaced and retyped)
+            self._show_exists(event.value, True)
+            return
+        # Wait for a pause in typing rather than stat-ing the path on every keystroke
+        self._exists_timer = self.set_timer(EXISTS_CHECK_DELAY, lambda value=event.value: self._check_exists(value))
+
+    @work(thread=True, exclusive=True, group="path_exists")
+    def _check_exists(self, value: str) -> None:
+        # Runs in a thread so a slow filesystem can't stall the UI; a newer check cancels this one
+        file_path = value.strip()
+        exists = bool(file_path and os.path.exists(file_path))
+        if exists:
+            self._existing_paths.add(file_path)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_exists, value, exists)
+
+    def _show_exists(self, value: str, exists: bool) -> None:
+        if value != self.query_one("#file_path_input", Input).value:
+            return # Stale check; a newer one is already scheduled
         warning_label = self.query_one("#overwrite_warning", Label)
-        warning_label.display = bool(file_path and os.path.exists(file_path))
+        warning_label.display = exists
+        self._warned_path = value.strip() if exists else None
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "save_as_button":
@@ -69,6 +100,11 @@ class FileSaveAsScreen(ModalScreen):
                 self.notify("File name must end with .json", severity="error", title="Input Error")
                 file_path_input.focus()
                 return
+            if os.path.exists(file_path) and self._warned_path != file_path:
+                # The debounced check hasn't shown the warning for this path yet, so show it before overwriting
+                self._show_exists(file_path_input.value, True)
+                self.notify("File exists and will be overwritten. Press Save As again to confirm.", severity="warning", title="Confirmation Needed")
+                return
             self.dismiss(file_path)
         elif event.button.id == "cancel_button":
             self.dismiss(None) 
\ No newline at end of file
@@ -2,7 +2,18 @@ from textual.app import ComposeResult, App
 from textual.screen import Screen
 from textual.widgets import Header, Footer, DataTable
 from textual.containers import ScrollableContainer # For horizontal and vertical scrolling if needed
+from rich.style import Style
 from rich.text import Text # For styling cells
+from data_manager import is_sorted_newest_first
+
+# Snapshot rows added per refresh; the first chunk is on screen before the rest are built.
+ROW_CHUNK_SIZE = 50
+
+# Cell styles, parsed once rather than from a style string per cell
+POSITIVE_STYLE = Style(color="green")
+NEGATIVE_STYLE = Style(color="red")
+ZERO_STYLE = Style(color="grey50", dim=True)
+MISSING_CELL = Text("-", style="dim", justify="center") # Shared placeholder if no balance for an item in a snapshot
 
 class HistoricalDataScreen(Screen):
     """A screen to display historical snapshot data in a pivot-table like view."""
@@ -12,8 +23,11 @@ class HistoricalDataScreen(Screen):
     def __init__(self, financial_items: list, snapshots: list):
         super().__init__()
         self.financial_items = sorted(financial_items, key=lambda x: x.get('name', '').lower()) # Sort items by name for consistent column order
-        self.snapshots = sorted(snapshots, key=lambda x: x.get('date', ''), reverse=True) # Ensure snapshots are newest first
-        self.item_id_to_name = {item['id']: item['name'] for item in self.financial_items}
+        # Ensure snapshots are newest first; the app already keeps them that way, so only sort when needed
+        if is_sorted_newest_first(snapshots):
+            self.snapshots = snapshots
+        else:
+            self.snapshots = sorted(snapshots, key=lambda x: x.get('date', ''), reverse=True)
 
     def compose(self) -> ComposeResult:
         yield Header(name="Historical Snapshot Data")
@@ -36,17 +50,34 @@ class HistoricalDataScreen(Screen):
             table.add_row("No snapshot data available.")
             return
 
-        for snapshot in self.snapshots:
+        self.table = table
+        self.item_ids = [item['id'] for item in self.financial_items] # Column order
+        self._append_chunk(0)
+
+    def _append_chunk(self, start: int) -> None:
+        """Adds the next ROW_CHUNK_SIZE snapshot rows, then schedules the following chunk
+           after the next refresh so the screen paints and keys (Esc) are handled in between.
+        """
+        if not self.is_attached: # Screen was closed before all rows were added
+            return
+        end = start + ROW_CHUNK_SIZE
+        item_ids = self.item_ids
+        rows = []
+        for snapshot in self.snapshots[start:end]:
             row_data = [snapshot.get('date', 'N/A')]
             snapshot_balances_map = {bal_entry['item_id']: bal_entry['balance'] for bal_entry in snapshot.get('balances', [])}
             
-            for item in self.financial_items: # Iterate in the defined column order
-                balance = snapshot_balances_map.get(item['id'])
+            for item_id in item_ids: # Iterate in the defined column order
+                balance = snapshot_balances_map.get(item_id)
                 if balance is not None:
                     balance_str = f"£{balance:,.2f}"
-                    style = "green" if balance > 0 else "red" if balance < 0 else "dim grey"
+                    style = POSITIVE_STYLE if balance > 0 else NEGATIVE_STYLE if balance < 0 else ZERO_STYLE
                     row_data.append(Text(balance_str, style=style, justify="right"))
                 else:
-                    row_data.append(Text("-", style="dim", justify="center")) # Placeholder if no balance for this item in this snapshot
+                    row_data.append(MISSING_CELL)
             
-            table.add_row(*row_data) 
\ No newline at end of file
+            rows.append(row_data)
+
+        self.table.add_rows(rows) # One call per chunk rather than add_row() per snapshot
+        if end < len(self.snapshots):
+            self.call_after_refresh(self._append_chunk, end)
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("rich")
+pytest.importorskip("textual")
+
+
+def test_module_imports():
+    # Styles are built at import time, so an unknown color name would raise here
+    from screens import historical_data_screen
+
+    assert historical_data_screen.ZERO_STYLE.dim
+    assert historical_data_screen.HistoricalDataScreen is not None
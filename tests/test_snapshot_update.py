@@ -0,0 +1,77 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core_logic import validate_snapshot_input
+from data_manager import is_in_sync_with_disk, load_historical_data
+
+KNOWN_IDS = {"item_1", "item_2"}
+
+
+def _snapshot(**overrides):
+    snapshot = {"date": "2024-03-31", "balances": [{"item_id": "item_1", "balance": 100.0}]}
+    snapshot.update(overrides)
+    return snapshot
+
+
+def test_valid_snapshot_is_accepted():
+    assert validate_snapshot_input(_snapshot(), KNOWN_IDS) is None
+    assert validate_snapshot_input(_snapshot(balances=[{"item_id": "item_2", "balance": -5}]), KNOWN_IDS) is None
+
+
+def test_rejects_non_dict_top_level():
+    assert validate_snapshot_input([_snapshot()], KNOWN_IDS)
+    assert validate_snapshot_input("2024-03-31", KNOWN_IDS)
+
+
+def test_rejects_missing_or_non_string_date():
+    snapshot = _snapshot()
+    del snapshot["date"]
+    assert validate_snapshot_input(snapshot, KNOWN_IDS)
+    assert validate_snapshot_input(_snapshot(date=20240331), KNOWN_IDS)
+
+
+def test_rejects_malformed_date():
+    for bad_date in ("31/03/2024", "2024-3-31", "2024-03-31\n", "2024-02-30", ""):
+        assert validate_snapshot_input(_snapshot(date=bad_date), KNOWN_IDS), bad_date
+
+
+def test_rejects_malformed_balances():
+    assert validate_snapshot_input(_snapshot(balances={"item_1": 1.0}), KNOWN_IDS)
+    assert validate_snapshot_input(_snapshot(balances=["item_1"]), KNOWN_IDS)
+
+
+def test_rejects_unknown_item_id():
+    assert validate_snapshot_input(_snapshot(balances=[{"item_id": "item_9", "balance": 1.0}]), KNOWN_IDS)
+
+
+def test_rejects_non_numeric_balance():
+    for bad_balance in ("100", None, True, [1]):
+        snapshot = _snapshot(balances=[{"item_id": "item_1", "balance": bad_balance}])
+        assert validate_snapshot_input(snapshot, KNOWN_IDS), bad_balance
+
+
+def test_failed_load_is_not_in_sync(tmp_path):
+    # The update command only saves when the data file loaded (is in sync with disk)
+    corrupt_file = tmp_path / "corrupt.json"
+    corrupt_file.write_text("{not json")
+    load_historical_data(None, str(corrupt_file))
+    assert not is_in_sync_with_disk(str(corrupt_file))
+
+    wrong_shape_file = tmp_path / "wrong_shape.json"
+    wrong_shape_file.write_text(json.dumps([1, 2, 3]))
+    load_historical_data(None, str(wrong_shape_file))
+    assert not is_in_sync_with_disk(str(wrong_shape_file))
+
+    missing_file = tmp_path / "missing.json"
+    load_historical_data(None, str(missing_file))
+    assert not is_in_sync_with_disk(str(missing_file))
+
+
+def test_successful_load_is_in_sync(tmp_path):
+    data_file = tmp_path / "data.json"
+    data_file.write_text(json.dumps({"categories": [], "financial_items": [], "snapshots": []}))
+    load_historical_data(None, str(data_file))
+    assert is_in_sync_with_disk(str(data_file))
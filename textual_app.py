@@ -13,7 +13,10 @@ from data_manager import (
     load_historical_data,
     save_historical_data,
     save_last_opened_file,
-    load_last_opened_file
+    load_last_opened_file,
+    insert_snapshot_sorted,
+    find_snapshot_by_date,
+    is_in_sync_with_disk
 )
 from core_logic import (
     calculate_summary_stats, 
@@ -172,6 +175,32 @@ class NetWorthApp(App):
         self.unsaved_changes = False
         self.achieved_milestones: List[Any] = [] # Initialize achieved_milestones
         self.financial_goal: Optional[Dict[str, Any]] = None # Initialize financial_goal
+        # Category lookups shared by the asset screens, and the categories list they were built from
+        self._category_lookups: tuple[dict, list] = ({}, [])
+        self._category_lookups_source: list | None = None
+
+    @staticmethod
+    def _build_category_lookups(categories: list) -> tuple[dict, list]:
+        """Builds (category id -> name map, category Select options) for a categories list."""
+        category_map = {cat['id']: cat['name'] for cat in categories}
+        # Each category's id is read once, both to filter out blank ids and as the option value
+        category_options = [
+            (cat.get('name', 'Unnamed Category'), cat_id) for cat in categories if (cat_id := cat.get('id'))
+        ]
+        return category_map, category_options
+
+    def get_category_lookups(self, categories: list | None = None) -> tuple[dict, list]:
+        """Returns (category id -> name map, category Select options) for self.categories.
+           Built once per categories list and reused by every asset screen push. The TUI
+           never edits categories in place, it only replaces the list (load, new file).
+           A screen given some other categories list gets lookups built just for it.
+        """
+        if categories is not None and categories is not self.categories:
+            return self._build_category_lookups(categories)
+        if self._category_lookups_source is not self.categories:
+            self._category_lookups = self._build_category_lookups(self.categories)
+            self._category_lookups_source = self.categories
+        return self._category_lookups
 
     def _load_and_prepare_data(self) -> None:
         """Loads data from file, prepares defaults if needed, and sets app attributes."""
@@ -549,6 +578,12 @@ class NetWorthApp(App):
                 self.notify(f"Error: Invalid file type. Please select a .json file.", title="File Open Error", severity="error")
                 return
 
+            # Re-opening the current file is a no-op if nothing has changed it on disk;
+            # every edit is saved immediately, so memory already matches the file.
+            if os.path.abspath(file_path) == os.path.abspath(self.current_data_file) and is_in_sync_with_disk(file_path):
+                self.notify(f"{file_path} is already open and up to date.", title="File Open", severity="information")
+                return
+
             # Attempt to load data from the new path
             loaded_data = load_historical_data(self._rich_console_for_utils, file_path)
 
@@ -674,27 +709,25 @@ class NetWorthApp(App):
         today_str = datetime.now().strftime("%Y-%m-%d")
         
         # The updated_balances list is a direct list of {'item_id': id, 'balance': val}
-        # This will become the new self.current_snapshot_balances for today
+        # This will become the new self.current_snapshot_balances for today.
+        # The screen builds these dicts fresh, so they are used as-is rather than copied.
         new_balances_for_today = updated_balances # Already in the correct format
 
-        snapshot_updated_in_list = False
-        for i, snap in enumerate(self.snapshots):
-            if snap.get('date') == today_str:
-                snap['balances'] = [bal.copy() for bal in new_balances_for_today] 
-                snapshot_updated_in_list = True
-                break
-        
-        if not snapshot_updated_in_list:
-            self.snapshots.append({
+        # Updating an existing snapshot in place keeps the newest-first order,
+        # so only a brand new snapshot needs placing (no full re-sort)
+        todays_snapshot = find_snapshot_by_date(self.snapshots, today_str)
+        if todays_snapshot is not None:
+            todays_snapshot['balances'] = new_balances_for_today
+        else:
+            insert_snapshot_sorted(self.snapshots, {
                 "date": today_str,
-                "balances": [bal.copy() for bal in new_balances_for_today]
+                "balances": new_balances_for_today
             })
         
-        self.snapshots.sort(key=lambda x: x.get('date', ''), reverse=True)
-        
         # Crucially, update the app's main current_date and current_snapshot_balances to reflect today
         self.current_date = today_str
-        self.current_snapshot_balances = [bal.copy() for bal in new_balances_for_today]
+        # Same shallow-list relationship to the snapshot as set up on load
+        self.current_snapshot_balances = list(new_balances_for_today)
 
         self.update_dashboard() # This will now trigger FIRE calculations which might update achieved_milestones
         self.notify(f"Balances for {today_str} updated. Saving data...", title="Balances Updated", severity="information")
@@ -710,13 +743,14 @@ class NetWorthApp(App):
         today_str = datetime.now().strftime("%Y-%m-%d")
         balances_for_today_screen = []
 
-        # Try to find an existing snapshot for today
-        todays_snapshot = next((snap for snap in self.snapshots if snap.get('date') == today_str), None)
+        # Try to find an existing snapshot for today. The balances are only read below
+        # (to build final_balances_for_screen), so they are not copied.
+        todays_snapshot = find_snapshot_by_date(self.snapshots, today_str)
 
         if todays_snapshot:
-            balances_for_today_screen = todays_snapshot.get('balances', []).copy()
+            balances_for_today_screen = todays_snapshot.get('balances', [])
         elif self.snapshots: # If no snapshot for today, use the most recent historical one as a starting point
-            balances_for_today_screen = self.snapshots[0].get('balances', []).copy()
+            balances_for_today_screen = self.snapshots[0].get('balances', [])
         else: # No historical snapshots either, start with zeros for all items
             balances_for_today_screen = [{'item_id': item['id'], 'balance': 0.0} for item in self.financial_items]
 
@@ -778,12 +812,13 @@ class NetWorthApp(App):
         current_financial_item_ids = {item['id'] for item in self.financial_items}
         for snapshot in self.snapshots:
             snapshot['balances'] = [bal for bal in snapshot.get('balances', []) if bal['item_id'] in current_financial_item_ids]
-            # For the current date snapshot, ensure all current items are present
-            if snapshot.get('date') == self.current_date:
-                snapshot_item_ids = {bal['item_id'] for bal in snapshot['balances']}
-                for item_id in current_financial_item_ids:
-                    if item_id not in snapshot_item_ids:
-                        snapshot['balances'].append({'item_id': item_id, 'balance': 0.0})
+        # For the current date snapshot, ensure all current items are present
+        current_date_snapshot = find_snapshot_by_date(self.snapshots, self.current_date)
+        if current_date_snapshot is not None:
+            snapshot_item_ids = {bal['item_id'] for bal in current_date_snapshot['balances']}
+            for item_id in current_financial_item_ids:
+                if item_id not in snapshot_item_ids:
+                    current_date_snapshot['balances'].append({'item_id': item_id, 'balance': 0.0})
 
         self.update_dashboard() # This will now trigger FIRE calculations
         self.notify("Financial items updated. Saving data...", title="Asset Management", severity="information")
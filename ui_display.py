@@ -3,27 +3,38 @@ from rich.table import Table
 from rich.text import Text
 from rich import box
 import collections # For  collections.abc.Iterable which is what enumerate wants
+import math # For math.fsum when totalling balances
 
 # Note: datetime might be needed if print_final_summary or display_assets re-formats dates,
 # but for now, they seem to receive them pre-formatted or just display as is.
 
+# Shared liquid-status cells, reused for every row instead of rebuilt per item
+_LIQUID_YES_TEXT = Text("Yes", style="green")
+_LIQUID_NO_TEXT = Text("No", style="red")
+
+# The title banner never changes, so it is built once at import
+_APP_TITLE_TEXT = Text.assemble(
+    Text("Net Worth Tracker", style="bold green"),
+    "\n",
+    Text("Track your financial journey", style="italic dim")
+)
+
 def display_app_title(console: Console):
     """Displays a visually appealing application title."""
-    title_text = Text("Net Worth Tracker", style="bold green")
-    subtitle_text = Text("Track your financial journey", style="italic dim")
-    
-    console.print(title_text, justify="center")
-    console.print(subtitle_text, justify="center")
-    console.print() # Add a blank line for spacing
+    # One write for the whole banner; the trailing newline adds spacing below it
+    console.print(_APP_TITLE_TEXT, justify="center", end="\n\n")
 
-def display_assets(console: Console, snapshot_balances: collections.abc.Iterable, financial_items: collections.abc.Iterable, categories_list: collections.abc.Iterable, show_balances=True, show_categories=True, table_title="Current Financial Snapshot"):
-    """Displays the current list of financial items and their balances in a Rich Table."""
+def display_assets(console: Console, snapshot_balances: collections.abc.Iterable, financial_items: collections.abc.Iterable, categories_list: collections.abc.Iterable, show_balances=True, show_categories=True, table_title="Current Financial Snapshot", items_by_id: dict | None = None, cats_by_id: dict | None = None):
+    """Displays the current list of financial items and their balances in a Rich Table.
+       Callers that already have id -> item / id -> category dicts can pass them as
+       items_by_id / cats_by_id to avoid rebuilding them here.
+    """
     if not snapshot_balances:
         console.print("[yellow]No balances to display for the current snapshot.[/yellow]")
         return
 
-    items_dict = {item['id']: item for item in financial_items}
-    cats_dict = {cat['id']: cat for cat in categories_list}
+    items_dict = items_by_id if items_by_id is not None else {item['id']: item for item in financial_items}
+    cats_dict = cats_by_id if cats_by_id is not None else {cat['id']: cat for cat in categories_list}
 
     table = Table(
         title=Text(table_title, style="bold"),
@@ -47,24 +58,19 @@ def display_assets(console: Console, snapshot_balances: collections.abc.Iterable
 
     for idx, balance_entry in enumerate(snapshot_balances, 1):
         item_id = balance_entry.get("item_id")
-        actual_balance = balance_entry.get("balance", 0.0)
-
         item_details = items_dict.get(item_id)
 
         if not item_details:
             item_name_str = f"Unknown Item (ID: {item_id})"
-            category_name_str = "Unknown"
             is_liquid = False
         else:
             item_name_str = item_details.get("name", f"Unnamed Item (ID: {item_id})")
-            category_id = item_details.get("category_id")
-            category_details = cats_dict.get(category_id)
-            category_name_str = category_details.get("name", "Uncategorized") if category_details else "Invalid Category ID"
             is_liquid = item_details.get("liquid", False)
 
         row_content = [str(idx), item_name_str]
         
         if show_balances:
+            actual_balance = balance_entry.get("balance", 0.0)
             total_balance_val += actual_balance
             if is_liquid:
                  liquid_balance_val += actual_balance
@@ -72,14 +78,18 @@ def display_assets(console: Console, snapshot_balances: collections.abc.Iterable
                  non_liquid_balance_val += actual_balance
             
             balance_color_style = "green" if actual_balance >= 0 else "red"
-            balance_text_str = Text(f"£{actual_balance:,.2f}", style=balance_color_style)
-            row_content.append(balance_text_str)
+            row_content.append(Text(f"£{actual_balance:,.2f}", style=balance_color_style))
         
         if show_categories:
+            # Only resolve the category when its column is actually shown
+            if not item_details:
+                category_name_str = "Unknown"
+            else:
+                category_details = cats_dict.get(item_details.get("category_id"))
+                category_name_str = category_details.get("name", "Uncategorized") if category_details else "Invalid Category ID"
             row_content.append(category_name_str)
         
-        liquid_status_text = Text("Yes", style="green") if is_liquid else Text("No", style="red")
-        row_content.append(liquid_status_text)
+        row_content.append(_LIQUID_YES_TEXT if is_liquid else _LIQUID_NO_TEXT)
         
         table.add_row(*row_content)
 
@@ -116,15 +126,17 @@ def display_assets(console: Console, snapshot_balances: collections.abc.Iterable
 
 def print_final_summary(console: Console, entry_date: str, snapshot_balances: collections.abc.Iterable, financial_items: collections.abc.Iterable, categories_list: collections.abc.Iterable):
     """Prints a final summary including date, item balances, and total net worth."""
-    console.print("\n[bold green]------------------------------------[/bold green]")
-    console.print(f"[bold green]Net Worth Summary for [cyan]{entry_date}[/cyan][/bold green]")
+    console.print(
+        "\n[bold green]------------------------------------[/bold green]\n"
+        f"[bold green]Net Worth Summary for [cyan]{entry_date}[/cyan][/bold green]"
+    )
     if not snapshot_balances:
         console.print("[yellow]No item balances were entered for this date.[/yellow]")
     else:
         console.print("[bold blue]Your final item balances are:[/bold blue]")
         display_assets(console, snapshot_balances, financial_items, categories_list, show_balances=True, show_categories=True, table_title=f"Summary for {entry_date}")
         
-        total_net_worth = sum(balance_entry.get('balance', 0.0) for balance_entry in snapshot_balances)
+        total_net_worth = math.fsum(balance_entry.get('balance', 0.0) for balance_entry in snapshot_balances)
         
         console.print("\n------------------------------------")
         console.print(f"[bold white on blue] Total Net Worth: £{total_net_worth:,.2f} [/bold white on blue]")